@@ -12,7 +12,10 @@ else:
 SETTINGS = {
     'animations_enabled': True,
     'animation_speed': 0.03,  # Seconds
+    'plot_charts': False,  # Draw plotext chart above the ASCII bars
     'auto_save': True,
+    'autosave_every': 1,  # Answers between session writes
+    'persist_sessions': True,  # Write session files at all (off in unit tests)
     'export_directory': Path.home() / 'Documents' / 'MBTI_Results',
     'theme': 'dark',  # 'dark' or 'light'
     'unicode_support': True,  # False for ASCII-only terminals
@@ -70,6 +73,9 @@ DIMENSIONS = {
     }
 }
 
+# Canonical dimension order for iteration and type codes
+DIMENSION_KEYS = ('E_I', 'S_N', 'T_F', 'J_P')
+
 # Error messages
 ERROR_MESSAGES = {
     'file_not_found': "❌ Required data files not found",
@@ -1,24 +1,148 @@
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
-import json
 from pathlib import Path
-from config.settings import DIMENSIONS
+from config.settings import DIMENSIONS, DIMENSION_KEYS
+from utils.serialization import loads
+
+# Dimension iteration order with per-dimension lookups precomputed from DIMENSIONS
+_DIM_ORDER = DIMENSION_KEYS
+_DIM_CODES = tuple(
+    (DIMENSIONS[d]['left']['code'], DIMENSIONS[d]['right']['code']) for d in _DIM_ORDER
+)
+_DIM_LABELS = tuple(
+    (DIMENSIONS[d]['left']['label'], DIMENSIONS[d]['right']['label']) for d in _DIM_ORDER
+)
+_DIM_NAMES = tuple(DIMENSIONS[d]['name'] for d in _DIM_ORDER)
+_DIM_INDEX = {d: i for i, d in enumerate(_DIM_ORDER)}
+
+# (threshold, label) pairs for describing preference strength, strongest first
+_STRENGTH_PREFIXES = ((70, "Strong"), (60, "Moderate"))
+
+# This is a simplified model - real compatibility is more complex
+_TYPE_GROUPS = {
+    'analysts': ('INTJ', 'INTP', 'ENTJ', 'ENTP'),
+    'diplomats': ('INFJ', 'INFP', 'ENFJ', 'ENFP'),
+    'sentinels': ('ISTJ', 'ISFJ', 'ESTJ', 'ESFJ'),
+    'explorers': ('ISTP', 'ISFP', 'ESTP', 'ESFP')
+}
+# Each type mapped to the other members of its group
+_COMPAT_PEERS = {
+    t: tuple(peer for peer in types if peer != t)
+    for types in _TYPE_GROUPS.values() for t in types
+}
+
+def _right_percentage(total_score: int, response_count: int) -> float:
+    """
+    Normalize a dimension's adjusted total to the right-side (E, N, T, J) percentage.
+    
+    Pure function of two integers so callers can re-score hypothetical
+    totals without touching scorer state.
+    
+    Args:
+        total_score: Sum of reverse-coding-adjusted values (1-5 each)
+        response_count: Number of responses in the total
+    
+    Returns:
+        Percentage on a 0-100 scale
+    """
+    max_possible = response_count * 5
+    min_possible = response_count * 1
+    
+    if max_possible > min_possible:
+        normalized = (total_score - min_possible) / (max_possible - min_possible)
+        return normalized * 100
+    return 50.0
+
+@lru_cache(maxsize=4)
+def _load_personality_types(path: str) -> Dict:
+    """
+    Load the personality type descriptions once per file.
+    
+    Args:
+        path: Resolved path to personality_types.json
+        
+    Returns:
+        Type descriptions shared by every analyzer using this file
+    """
+    return loads(Path(path).read_bytes())
 
 class MBTIScorer:
     """Core scoring engine for MBTI assessment."""
     
     def __init__(self):
         self.dimensions = DIMENSIONS
+        # question_id -> (dimension index, value, reverse_coded)
         self.responses = {}
+        # Cached per-dimension results; entries in _dirty need recalculating
         self.dimension_scores = {}
+        self._dirty = set(_DIM_ORDER)
+        # Running reverse-coding-adjusted totals and response counts, indexed like _DIM_ORDER
+        self._dim_totals = [0] * len(_DIM_ORDER)
+        self._dim_counts = [0] * len(_DIM_ORDER)
         
     def add_response(self, question_id: str, question_data: dict, response_value: int):
         """Add a response to the scoring system."""
-        self.responses[question_id] = {
-            'dimension': question_data['dimension'],
-            'value': response_value,
-            'reverse_coded': question_data.get('reverse_coded', False)
+        # Discount the old value if this question is being re-answered
+        self.remove_response(question_id)
+        
+        dim_idx = _DIM_INDEX[question_data['dimension']]
+        reverse_coded = question_data.get('reverse_coded', False)
+        self.responses[question_id] = (dim_idx, response_value, reverse_coded)
+        
+        self._dim_totals[dim_idx] += 6 - response_value if reverse_coded else response_value
+        self._dim_counts[dim_idx] += 1
+        self._dirty.add(_DIM_ORDER[dim_idx])
+    
+    def remove_response(self, question_id: str) -> bool:
+        """
+        Remove a response from the scoring system.
+        
+        Args:
+            question_id: Question identifier
+        
+        Returns:
+            True if a response was removed, False if none was recorded
+        """
+        response = self.responses.pop(question_id, None)
+        if response is None:
+            return False
+        
+        dim_idx, value, reverse_coded = response
+        self._dim_totals[dim_idx] -= 6 - value if reverse_coded else value
+        self._dim_counts[dim_idx] -= 1
+        self._dirty.add(_DIM_ORDER[dim_idx])
+        return True
+    
+    def get_response(self, question_id: str) -> Optional[Dict]:
+        """
+        Get a recorded response in readable form.
+        
+        Args:
+            question_id: Question identifier
+        
+        Returns:
+            Dictionary with dimension, value and reverse_coded, or None
+        """
+        response = self.responses.get(question_id)
+        if response is None:
+            return None
+        
+        dim_idx, value, reverse_coded = response
+        return {
+            'dimension': _DIM_ORDER[dim_idx],
+            'value': value,
+            'reverse_coded': reverse_coded
         }
     
+    def get_response_values(self) -> List[int]:
+        """Get raw response values in the order they were recorded."""
+        return [value for _, value, _ in self.responses.values()]
+    
+    def get_response_count(self, dimension: str) -> int:
+        """Get the number of responses recorded for a dimension."""
+        dim_idx = _DIM_INDEX.get(dimension)
+        return self._dim_counts[dim_idx] if dim_idx is not None else 0
+    
     def calculate_dimension_score(self, dimension: str) -> Dict:
         """
         Calculate percentage score for a dimension.
@@ -29,14 +153,14 @@ class MBTIScorer:
         Returns:
             Dictionary with scores and preference
         """
-        # Get all responses for this dimension
-        dim_responses = [
-            r for r in self.responses.values() 
-            if r['dimension'] == dimension
-        ]
+        if dimension not in self._dirty and dimension in self.dimension_scores:
+            return self.dimension_scores[dimension]
         
-        if not dim_responses:
-            return {
+        # Totals are kept up to date by add_response/remove_response
+        response_count = self.get_response_count(dimension)
+        
+        if not response_count:
+            score = {
                 'preference': 'X',
                 'strength': 50.0,
                 'right_score': 50.0,
@@ -44,69 +168,46 @@ class MBTIScorer:
                 'is_borderline': True,
                 'response_count': 0
             }
+            return self._cache_score(dimension, score)
         
-        total_score = 0
-        max_possible = len(dim_responses) * 5
-        min_possible = len(dim_responses) * 1
-        
-        for response in dim_responses:
-            # Handle reverse-coded questions
-            if response['reverse_coded']:
-                adjusted_value = 6 - response['value']
-            else:
-                adjusted_value = response['value']
-            
-            total_score += adjusted_value
-        
-        # Calculate percentage for right side (E, N, T, J)
-        # Formula: normalize to 0-100 scale
-        if max_possible > min_possible:
-            normalized = (total_score - min_possible) / (max_possible - min_possible)
-            right_percentage = normalized * 100
-        else:
-            right_percentage = 50.0
-        
+        dim_idx = _DIM_INDEX[dimension]
+        right_percentage = _right_percentage(self._dim_totals[dim_idx], response_count)
         left_percentage = 100 - right_percentage
         
-        # Determine preference with clearer boundaries
-        dim_config = self.dimensions[dimension]
-        
-        if right_percentage > 52:
-            preference = dim_config['right']['code']
-            strength = right_percentage
-            preferred_label = dim_config['right']['label']
-        elif right_percentage < 48:
-            preference = dim_config['left']['code']
-            strength = left_percentage
-            preferred_label = dim_config['left']['label']
-        else:
-            # Borderline case - use slight preference
-            if right_percentage >= 50:
-                preference = dim_config['right']['code']
-                preferred_label = dim_config['right']['label']
-            else:
-                preference = dim_config['left']['code']
-                preferred_label = dim_config['left']['label']
-            strength = 50.0
+        # Within 2 points of even is borderline: keep the slight preference
+        # but report no strength either way
+        pref_idx = int(right_percentage >= 50)
+        is_borderline = 48 <= right_percentage <= 52
+        strength = 50.0 if is_borderline else max(right_percentage, left_percentage)
+        labels = _DIM_LABELS[dim_idx]
         
-        return {
-            'preference': preference,
-            'preferred_label': preferred_label,
+        score = {
+            'preference': _DIM_CODES[dim_idx][pref_idx],
+            'preferred_label': labels[pref_idx],
             'strength': strength,
             'right_score': right_percentage,
             'left_score': left_percentage,
-            'right_label': dim_config['right']['label'],
-            'left_label': dim_config['left']['label'],
-            'is_borderline': 48 <= right_percentage <= 52,
-            'response_count': len(dim_responses)
+            'right_label': labels[1],
+            'left_label': labels[0],
+            'is_borderline': is_borderline,
+            'response_count': response_count
         }
+        return self._cache_score(dimension, score)
+    
+    def _cache_score(self, dimension: str, score: Dict) -> Dict:
+        """Store a freshly calculated score for a known dimension."""
+        if dimension in _DIM_INDEX:
+            self.dimension_scores[dimension] = score
+            self._dirty.discard(dimension)
+        return score
     
     def calculate_all_dimensions(self) -> Dict[str, Dict]:
-        """Calculate scores for all dimensions."""
-        self.dimension_scores = {}
-        for dimension in ['E_I', 'S_N', 'T_F', 'J_P']:
-            self.dimension_scores[dimension] = self.calculate_dimension_score(dimension)
-        return self.dimension_scores
+        """Calculate scores for all dimensions, reusing cached ones that are still valid."""
+        for dimension in _DIM_ORDER:
+            self.calculate_dimension_score(dimension)
+        # A snapshot, so later answers don't change results already handed
+        # out; score dicts are replaced on recalculation, never mutated
+        return dict(self.dimension_scores)
     
     def determine_mbti_type(self) -> Dict:
         """
@@ -115,33 +216,38 @@ class MBTIScorer:
         Returns:
             Dictionary with type code, confidence, and details
         """
-        if not self.dimension_scores:
+        if self._dirty:
             self.calculate_all_dimensions()
         
-        type_code = ""
+        type_chars = []
         total_confidence = 0
         borderline_dimensions = []
         dimension_details = []
+        dimension_scores = self.dimension_scores
         
-        for dimension in ['E_I', 'S_N', 'T_F', 'J_P']:
-            score = self.dimension_scores[dimension]
+        for dimension, dimension_name in zip(_DIM_ORDER, _DIM_NAMES):
+            score = dimension_scores[dimension]
+            strength = score['strength']
+            is_borderline = score['is_borderline']
             
-            if score['is_borderline']:
+            if is_borderline:
                 borderline_dimensions.append({
-                    'dimension': self.dimensions[dimension]['name'],
+                    'dimension': dimension_name,
                     'scores': f"{score['left_label']} ({score['left_score']:.1f}%) vs {score['right_label']} ({score['right_score']:.1f}%)"
                 })
             
-            type_code += score['preference']
-            total_confidence += score['strength']
+            type_chars.append(score['preference'])
+            total_confidence += strength
             
             dimension_details.append({
-                'dimension': self.dimensions[dimension]['name'],
+                'dimension': dimension_name,
                 'preference': score['preferred_label'],
-                'strength': score['strength'],
-                'is_borderline': score['is_borderline']
+                'strength': strength,
+                'is_borderline': is_borderline
             })
         
+        type_code = "".join(type_chars)
+        
         # Average confidence across all dimensions
         confidence = total_confidence / 4
         
@@ -156,7 +262,7 @@ class MBTIScorer:
         # Get secondary type if there are borderline dimensions
         secondary_type = None
         if borderline_dimensions:
-            secondary_type = self._get_secondary_type()
+            secondary_type = self._get_secondary_type(type_code)
         
         return {
             'type': type_code,
@@ -168,25 +274,30 @@ class MBTIScorer:
             'total_responses': len(self.responses)
         }
     
-    def _get_secondary_type(self) -> Optional[str]:
-        """Determine secondary type for borderline cases."""
-        secondary = ""
+    def _get_secondary_type(self, primary: str) -> Optional[str]:
+        """
+        Determine secondary type for borderline cases.
+        
+        Args:
+            primary: Primary type code already built from dimension_scores
+        """
+        secondary = []
+        dimension_scores = self.dimension_scores
         
-        for dimension in ['E_I', 'S_N', 'T_F', 'J_P']:
-            score = self.dimension_scores[dimension]
+        for dimension, (left_code, right_code) in zip(_DIM_ORDER, _DIM_CODES):
+            score = dimension_scores[dimension]
             
             if score['is_borderline']:
                 # Flip to the other preference
-                dim_config = self.dimensions[dimension]
-                if score['preference'] == dim_config['right']['code']:
-                    secondary += dim_config['left']['code']
+                if score['preference'] == right_code:
+                    secondary.append(left_code)
                 else:
-                    secondary += dim_config['right']['code']
+                    secondary.append(right_code)
             else:
-                secondary += score['preference']
+                secondary.append(score['preference'])
         
         # Only return if different from primary
-        primary = self.determine_mbti_type()['type']
+        secondary = "".join(secondary)
         return secondary if secondary != primary else None
     
     def get_detailed_results(self) -> Dict:
@@ -197,7 +308,7 @@ class MBTIScorer:
             'mbti_type': mbti_result['type'],
             'confidence': mbti_result['confidence'],
             'confidence_level': mbti_result['confidence_level'],
-            'dimension_scores': self.dimension_scores,
+            'dimension_scores': dict(self.dimension_scores),
             'borderline_dimensions': mbti_result['borderline_dimensions'],
             'secondary_type': mbti_result['secondary_type'],
             'dimension_details': mbti_result['dimension_details'],
@@ -207,42 +318,57 @@ class MBTIScorer:
     
     def _get_response_breakdown(self) -> Dict:
         """Get breakdown of responses by dimension."""
+        raw_totals = [0] * len(_DIM_ORDER)
+        for dim_idx, value, _ in self.responses.values():
+            raw_totals[dim_idx] += value
+        
         breakdown = {}
         
-        for dimension in ['E_I', 'S_N', 'T_F', 'J_P']:
-            dim_responses = [
-                r for r in self.responses.values() 
-                if r['dimension'] == dimension
-            ]
-            
+        for dim_idx, dimension in enumerate(_DIM_ORDER):
+            count = self._dim_counts[dim_idx]
             breakdown[dimension] = {
-                'count': len(dim_responses),
-                'average_score': sum(r['value'] for r in dim_responses) / len(dim_responses) if dim_responses else 0
+                'count': count,
+                'average_score': raw_totals[dim_idx] / count if count else 0
             }
         
         return breakdown
     
     def reset(self):
         """Reset the scorer for a new test."""
-        self.responses = {}
-        self.dimension_scores = {}
+        # Internal state is never handed out, so it is emptied in place
+        self.responses.clear()
+        self._dirty.update(_DIM_ORDER)
+        self._dim_totals[:] = (0,) * len(_DIM_ORDER)
+        self._dim_counts[:] = (0,) * len(_DIM_ORDER)
+        self.dimension_scores.clear()
 
 
 class ResultAnalyzer:
     """Analyze and provide insights on MBTI results."""
     
     def __init__(self, personality_types_path: Path):
-        with open(personality_types_path) as f:
-            self.personality_types = json.load(f)
+        # Type descriptions are only needed once results are shown,
+        # so defer reading them until first use
+        self._personality_types_path = personality_types_path
+        self._personality_types = None
+    
+    @property
+    def personality_types(self) -> Dict:
+        """Personality type descriptions, loaded on first access."""
+        if self._personality_types is None:
+            self._personality_types = _load_personality_types(
+                str(Path(self._personality_types_path).resolve())
+            )
+        return self._personality_types
     
     def get_type_analysis(self, mbti_type: str, dimension_scores: Dict) -> Dict:
         """Get detailed analysis for a personality type."""
-        if mbti_type not in self.personality_types:
+        type_data = self.personality_types.get(mbti_type)
+        if type_data is None:
             return {
                 'error': f'Unknown personality type: {mbti_type}'
             }
         
-        type_data = self.personality_types[mbti_type]
         
         # Add strength indicators
         strengths_analysis = self._analyze_strengths(dimension_scores)
@@ -261,14 +387,23 @@ class ResultAnalyzer:
         }
     
     def _analyze_strengths(self, dimension_scores: Dict) -> List[str]:
-        """Analyze dimension strengths and provide insights."""
+        """
+        Analyze dimension strengths and provide insights.
+        
+        Args:
+            dimension_scores: Per-dimension score dictionaries
+        
+        Returns:
+            Insights in dimension order
+        """
         insights = []
         
-        for dim_key, scores in dimension_scores.items():
-            if scores['strength'] > 70:
-                insights.append(f"Strong {scores['preferred_label']} preference ({scores['strength']:.1f}%)")
-            elif scores['strength'] > 60:
-                insights.append(f"Moderate {scores['preferred_label']} preference ({scores['strength']:.1f}%)")
+        for scores in dimension_scores.values():
+            strength = scores['strength']
+            prefix = next((p for threshold, p in _STRENGTH_PREFIXES if strength > threshold), None)
+            
+            if prefix:
+                insights.append(f"{prefix} {scores['preferred_label']} preference ({strength:.1f}%)")
             elif scores['is_borderline']:
                 insights.append(f"Balanced between {scores['left_label']} and {scores['right_label']}")
         
@@ -276,30 +411,9 @@ class ResultAnalyzer:
     
     def get_compatibility_insights(self, mbti_type: str) -> Dict:
         """Get compatibility insights with other types."""
-        # Simplified compatibility model
-        compatibilities = {
+        # Simplified compatibility model: same group = generally compatible
+        return {
             'highly_compatible': [],
-            'compatible': [],
+            'compatible': list(_COMPAT_PEERS.get(mbti_type, ())),
             'challenging': []
-        }
-        
-        # This is a simplified model - real compatibility is more complex
-        type_groups = {
-            'analysts': ['INTJ', 'INTP', 'ENTJ', 'ENTP'],
-            'diplomats': ['INFJ', 'INFP', 'ENFJ', 'ENFP'],
-            'sentinels': ['ISTJ', 'ISFJ', 'ESTJ', 'ESFJ'],
-            'explorers': ['ISTP', 'ISFP', 'ESTP', 'ESFP']
-        }
-        
-        # Find which group this type belongs to
-        my_group = None
-        for group, types in type_groups.items():
-            if mbti_type in types:
-                my_group = group
-                break
-        
-        if my_group:
-            # Same group = generally compatible
-            compatibilities['compatible'] = [t for t in type_groups[my_group] if t != mbti_type]
-        
-        return compatibilities
\ No newline at end of file
+        }
\ No newline at end of file
@@ -1,36 +1,72 @@
+import atexit
 import json
+import os
+import time
+import weakref
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from config.settings import SETTINGS
+from utils.serialization import dumps, loads, write_atomic
+
+# Managers that may hold answers not yet written to disk
+_open_managers = weakref.WeakSet()
+
+@atexit.register
+def _flush_open_sessions():
+    """Write out any batched answers when the interpreter exits."""
+    for manager in list(_open_managers):
+        # A manager left open on a since-removed directory has nowhere to write
+        if manager.session_dir.is_dir():
+            manager.flush()
 
 class SessionManager:
     """Handle saving and resuming test sessions."""
     
-    def __init__(self):
-        self.session_dir = SETTINGS['session_directory']
+    def __init__(self, session_dir: Optional[Path] = None):
+        """
+        Args:
+            session_dir: Where to keep session files, defaults to SETTINGS['session_directory']
+        """
+        self.session_dir = session_dir or SETTINGS['session_directory']
         self.session_dir.mkdir(exist_ok=True, parents=True)
         self.current_session = None
         self.session_file = None
+        # Maps question_id -> position in current_session['responses']
+        self._qid_to_index = {}
+        # Answers recorded since the last write, see SETTINGS['autosave_every']
+        self._unsaved_responses = 0
+        # Parsed session files as path -> (mtime, data), see _load_session_file
+        self._file_cache = {}
+        _open_managers.add(self)
     
-    def create_session(self, test_length: str, total_questions: int) -> str:
+    def create_session(self, test_length: str, total_questions: int,
+                       question_order: Optional[List[str]] = None) -> str:
         """
         Create new test session.
         
         Args:
             test_length: Type of test (short/medium/long)
             total_questions: Total number of questions
+            question_order: Question IDs in the order they will be asked
             
         Returns:
             Session ID
         """
-        session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Don't lose batched answers from a session we're switching away from
+        self.flush()
+        
+        now = datetime.now()
+        session_id = now.strftime('%Y%m%d_%H%M%S')
         self.current_session = {
             'id': session_id,
             'test_length': test_length,
             'total_questions': total_questions,
-            'started_at': datetime.now().isoformat(),
-            'last_updated': datetime.now().isoformat(),
+            'started_at': now.isoformat(),
+            'started_at_ts': now.timestamp(),
+            'last_updated': now.isoformat(),
+            'last_updated_ts': now.timestamp(),
+            'question_order': list(question_order or []),
             'responses': [],
             'current_question': 0,
             'completed': False,
@@ -38,20 +74,45 @@ class SessionManager:
         }
         
         self.session_file = self.session_dir / f"session_{session_id}.json"
-        self.save()
+        self._qid_to_index = {}
+        self.save(now)
         return session_id
     
-    def save(self):
-        """Auto-save current session."""
+    def save(self, now: Optional[datetime] = None):
+        """
+        Auto-save current session.
+        
+        Args:
+            now: Optional pre-computed time to record as last_updated
+        """
         if self.current_session and self.session_file:
-            self.current_session['last_updated'] = datetime.now().isoformat()
+            now = now or datetime.now()
+            self.current_session['last_updated'] = now.isoformat()
+            # POSIX timestamp so readers can compare without parsing the ISO string
+            self.current_session['last_updated_ts'] = now.timestamp()
+            
+            if not SETTINGS['persist_sessions']:
+                # Nothing is owed to disk, so flush() has nothing to write later
+                self._unsaved_responses = 0
+                return
             
             try:
-                with open(self.session_file, 'w') as f:
-                    json.dump(self.current_session, f, indent=2)
+                self._file_cache.pop(self.session_file, None)
+                write_atomic(self.session_file, dumps(self.current_session))
+                self._unsaved_responses = 0
             except Exception as e:
                 print(f"Warning: Could not save session: {e}")
     
+    def flush(self):
+        """Save the session if answers have been recorded since the last write."""
+        if self._unsaved_responses:
+            self.save()
+    
+    def close(self):
+        """Flush batched answers and stop tracking this manager for the exit flush."""
+        self.flush()
+        _open_managers.discard(self)
+    
     def find_incomplete_sessions(self) -> List[Dict]:
         """
         Find sessions that can be resumed.
@@ -60,27 +121,34 @@ class SessionManager:
             List of incomplete session data
         """
         sessions = []
+        timeout = timedelta(minutes=SETTINGS['session_timeout_minutes'])
+        timeout_seconds = timeout.total_seconds()
+        now_ts = time.time()
+        min_mtime = now_ts - timeout_seconds
         
         try:
-            for filepath in self.session_dir.glob("session_*.json"):
+            for filepath, mtime in self._scan_session_files():
+                # A file untouched since before the timeout cannot hold a
+                # recent last_updated, so skip it without opening
+                if mtime < min_mtime:
+                    continue
+                
                 try:
-                    with open(filepath) as f:
-                        data = json.load(f)
-                        
+                    data = self._load_session_file(filepath, mtime)
+                    
                     # Check if session is incomplete and not too old
                     if not data.get('completed', False):
-                        last_updated = datetime.fromisoformat(data['last_updated'])
-                        timeout = timedelta(minutes=SETTINGS['session_timeout_minutes'])
+                        last_updated_ts = self._last_updated_ts(data)
                         
-                        if datetime.now() - last_updated < timeout:
+                        if now_ts - last_updated_ts < timeout_seconds:
                             sessions.append({
                                 'id': data['id'],
                                 'test_length': data['test_length'],
                                 'progress': f"{data['current_question']}/{data['total_questions']}",
-                                'last_updated': last_updated.strftime('%Y-%m-%d %H:%M'),
+                                'last_updated': datetime.fromtimestamp(last_updated_ts).strftime('%Y-%m-%d %H:%M'),
                                 'filepath': str(filepath)
                             })
-                except (json.JSONDecodeError, KeyError):
+                except (json.JSONDecodeError, KeyError, ValueError, OSError):
                     continue
                     
         except Exception:
@@ -109,13 +177,16 @@ class SessionManager:
                 return None
         
         try:
-            with open(session_file) as f:
-                self.current_session = json.load(f)
+            with open(session_file, 'rb') as f:
+                self.current_session = loads(f.read())
             
             self.session_file = session_file
+            self._qid_to_index = {
+                r['question_id']: i
+                for i, r in enumerate(self.current_session['responses'])
+            }
             
             # Update last access time
-            self.current_session['last_updated'] = datetime.now().isoformat()
             self.save()
             
             return self.current_session
@@ -135,30 +206,63 @@ class SessionManager:
         if not self.current_session:
             raise ValueError("No active session")
         
+        now = datetime.now()
+        self._record_response(question_id, question_data, response_value, now.isoformat())
+        
+        # Batch writes when configured to save less often than every answer
+        self._unsaved_responses += 1
+        if self._unsaved_responses >= SETTINGS['autosave_every']:
+            self.save(now)
+    
+    def add_responses(self, answers: List[Tuple[str, Dict, int]]):
+        """
+        Add several responses and save once.
+        
+        Args:
+            answers: (question_id, question_data, response_value) per answer
+        """
+        if not self.current_session:
+            raise ValueError("No active session")
+        
+        now = datetime.now()
+        # One timestamp string for the whole batch
+        timestamp = now.isoformat()
+        for question_id, question_data, response_value in answers:
+            self._record_response(question_id, question_data, response_value, timestamp)
+        self.save(now)
+    
+    def _record_response(self, question_id: str, question_data: Dict,
+                         response_value: int, timestamp: str):
+        """
+        Store a response in the current session without saving.
+        
+        Args:
+            question_id: Question identifier
+            question_data: Full question data
+            response_value: User's response (1-5)
+            timestamp: ISO-format time to record for the response
+        """
         response_data = {
             'question_id': question_id,
             'dimension': question_data['dimension'],
             'value': response_value,
             'reverse_coded': question_data.get('reverse_coded', False),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp
         }
         
+        responses = self.current_session['responses']
+        
         # Check if this question was already answered (for back navigation)
-        existing = next(
-            (i for i, r in enumerate(self.current_session['responses']) 
-             if r['question_id'] == question_id), 
-            None
-        )
+        existing = self._qid_to_index.get(question_id)
         
         if existing is not None:
             # Update existing response
-            self.current_session['responses'][existing] = response_data
+            responses[existing] = response_data
         else:
             # Add new response
-            self.current_session['responses'].append(response_data)
+            self._qid_to_index[question_id] = len(responses)
+            responses.append(response_data)
             self.current_session['current_question'] += 1
-        
-        self.save()
     
     def go_back(self) -> bool:
         """
@@ -174,7 +278,8 @@ class SessionManager:
             self.current_session['current_question'] -= 1
             # Remove last response
             if self.current_session['responses']:
-                self.current_session['responses'].pop()
+                removed = self.current_session['responses'].pop()
+                self._qid_to_index.pop(removed['question_id'], None)
             self.save()
             return True
         
@@ -215,9 +320,12 @@ class SessionManager:
         percentage = (current / total * 100) if total > 0 else 0
         
         # Calculate time elapsed
-        started = datetime.fromisoformat(self.current_session['started_at'])
-        elapsed = datetime.now() - started
-        hours, remainder = divmod(elapsed.seconds, 3600)
+        started_ts = self.current_session.get('started_at_ts')
+        if started_ts is None:
+            started_ts = datetime.fromisoformat(self.current_session['started_at']).timestamp()
+            self.current_session['started_at_ts'] = started_ts
+        elapsed = int(time.time() - started_ts) % 86400
+        hours, remainder = divmod(elapsed, 3600)
         minutes, seconds = divmod(remainder, 60)
         
         if hours > 0:
@@ -237,37 +345,95 @@ class SessionManager:
         """
         Remove sessions older than specified days.
         
+        Age is taken from the file's modification time, which every save
+        refreshes, so no session file is opened. Corrupted files age out
+        the same way.
+        
         Args:
             days: Number of days to keep sessions
         """
-        cutoff = datetime.now() - timedelta(days=days)
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
         
         try:
-            for filepath in self.session_dir.glob("session_*.json"):
-                try:
-                    with open(filepath) as f:
-                        data = json.load(f)
-                    
-                    last_updated = datetime.fromisoformat(data.get('last_updated', data['started_at']))
-                    
-                    if last_updated < cutoff:
-                        filepath.unlink()
-                        
-                except (json.JSONDecodeError, KeyError, OSError):
-                    # Remove corrupted files
+            for filepath, mtime in self._scan_session_files():
+                if mtime < cutoff_ts:
+                    self._file_cache.pop(filepath, None)
                     try:
                         filepath.unlink()
-                    except:
+                    except OSError:
                         pass
         except Exception:
             pass
     
-    def export_session(self, format: str = 'json') -> Optional[str]:
+    @staticmethod
+    def _last_updated_ts(data: Dict) -> float:
+        """
+        Get a saved session's last update time as a POSIX timestamp.
+        
+        Sessions saved before last_updated_ts existed fall back to
+        parsing the ISO string.
+        
+        Args:
+            data: Loaded session data
+            
+        Returns:
+            Seconds since the epoch
+        """
+        if 'last_updated_ts' in data:
+            return data['last_updated_ts']
+        return datetime.fromisoformat(data.get('last_updated', data['started_at'])).timestamp()
+    
+    def _load_session_file(self, filepath: Path, mtime: float) -> Dict:
+        """
+        Load a saved session file, reusing the last parse if it is unchanged.
+        
+        Listing resumable sessions again only re-parses files that have
+        changed. The cached data is shared and must not be modified by
+        callers.
+        
+        Args:
+            filepath: Session file path
+            mtime: Modification time from _scan_session_files
+            
+        Returns:
+            Loaded session data
+        """
+        cached = self._file_cache.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(filepath, 'rb') as f:
+            data = loads(f.read())
+        self._file_cache[filepath] = (mtime, data)
+        return data
+    
+    def _scan_session_files(self) -> List[Tuple[Path, float]]:
+        """
+        List saved session files with their modification times.
+        
+        Uses a single directory scan so no file is opened here.
+        
+        Returns:
+            List of (path, mtime) tuples
+        """
+        entries = []
+        with os.scandir(self.session_dir) as it:
+            for entry in it:
+                if entry.name.startswith('session_') and entry.name.endswith('.json'):
+                    try:
+                        entries.append((Path(entry.path), entry.stat().st_mtime))
+                    except OSError:
+                        continue
+        return entries
+    
+    def export_session(self, format: str = 'json',
+                       directory: Optional[Path] = None) -> Optional[str]:
         """
         Export current session data.
         
         Args:
             format: Export format (json/txt)
+            directory: Where to write the file, defaults to SETTINGS['export_directory']
             
         Returns:
             Export file path or None
@@ -275,26 +441,29 @@ class SessionManager:
         if not self.current_session:
             return None
         
-        export_dir = SETTINGS['export_directory']
+        export_dir = directory or SETTINGS['export_directory']
         export_dir.mkdir(exist_ok=True, parents=True)
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         if format == 'json':
             filepath = export_dir / f"mbti_session_{timestamp}.json"
-            with open(filepath, 'w') as f:
-                json.dump(self.current_session, f, indent=2)
+            filepath.write_bytes(dumps(self.current_session, indent=True))
         else:
             filepath = export_dir / f"mbti_session_{timestamp}.txt"
-            with open(filepath, 'w') as f:
-                f.write(f"MBTI Test Session\n")
-                f.write(f"=" * 50 + "\n\n")
-                f.write(f"Session ID: {self.current_session['id']}\n")
-                f.write(f"Started: {self.current_session['started_at']}\n")
-                f.write(f"Test Length: {self.current_session['test_length']}\n")
-                f.write(f"Questions: {self.current_session['current_question']}/{self.current_session['total_questions']}\n")
-                
-                if self.current_session.get('mbti_result'):
-                    f.write(f"\nResult: {self.current_session['mbti_result']['type']}\n")
+            session = self.current_session
+            mbti_result = session.get('mbti_result')
+            result_line = f"\nResult: {mbti_result['type']}\n" if mbti_result else ""
+            
+            # Build the whole report first and write it in one call
+            filepath.write_text(
+                f"MBTI Test Session\n"
+                f"{'=' * 50}\n\n"
+                f"Session ID: {session['id']}\n"
+                f"Started: {session['started_at']}\n"
+                f"Test Length: {session['test_length']}\n"
+                f"Questions: {session['current_question']}/{session['total_questions']}\n"
+                f"{result_line}"
+            )
         
         return str(filepath)
\ No newline at end of file
@@ -1,11 +1,45 @@
-import json
 import random
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from core.scoring import MBTIScorer, ResultAnalyzer
 from core.session import SessionManager
 from core.validator import ResponseValidator
-from config.settings import TEST_CONFIGS, DIMENSIONS
+from config.settings import TEST_CONFIGS, DIMENSIONS, DIMENSION_KEYS
+from utils.serialization import loads
+
+@lru_cache(maxsize=4)
+def _load_questions(data_dir: str) -> Tuple[Dict, ...]:
+    """
+    Load the question bank once per data directory.
+    
+    Args:
+        data_dir: Resolved data directory path
+        
+    Returns:
+        Questions shared by every engine using this directory
+    """
+    return tuple(loads((Path(data_dir) / 'questions.json').read_bytes())['questions'])
+
+@lru_cache(maxsize=4)
+def _questions_by_dimension(data_dir: str) -> Dict[str, Tuple[Dict, ...]]:
+    """
+    Group the question bank by dimension, highest priority first.
+    
+    Args:
+        data_dir: Resolved data directory path
+        
+    Returns:
+        Mapping of dimension key to its questions sorted by priority
+    """
+    by_dim = {}
+    for q in _load_questions(data_dir):
+        by_dim.setdefault(q['dimension'], []).append(q)
+    return {
+        dim: tuple(sorted(dim_questions, key=lambda x: x['priority']))
+        for dim, dim_questions in by_dim.items()
+    }
 
 class TestEngine:
     """Main engine for running the MBTI test."""
@@ -14,9 +48,12 @@ class TestEngine:
         # Set data directory
         self.data_dir = data_dir or Path(__file__).parent.parent / 'data'
         
-        # Load questions
-        with open(self.data_dir / 'questions.json') as f:
-            self.all_questions = json.load(f)['questions']
+        # Load questions, shared with other engines on the same data directory
+        data_key = str(Path(self.data_dir).resolve())
+        self.all_questions = _load_questions(data_key)
+        self._by_dim = _questions_by_dimension(data_key)
+        # test_length -> selected questions before shuffling
+        self._selection_cache = {}
         
         # Initialize components
         self.session_manager = SessionManager()
@@ -27,6 +64,10 @@ class TestEngine:
         # Test state
         self.test_length = None
         self.questions = []
+        self._questions_by_id = {}
+        self._dim_question_counts = Counter()
+        # Question IDs in the order they were answered, for undo
+        self._response_stack = []
         self.current_index = 0
         self.is_resuming = False
     
@@ -41,65 +82,90 @@ class TestEngine:
             Session ID
         """
         self.test_length = test_length
-        config = TEST_CONFIGS[test_length]
         
         # Select questions based on test length
-        self.questions = self._select_questions(config)
+        self._set_questions(self._select_questions(test_length))
         
-        # Create session
+        # Create session, remembering the shuffled order for resume
         session_id = self.session_manager.create_session(
             test_length, 
-            len(self.questions)
+            len(self.questions),
+            [q['id'] for q in self.questions]
         )
         
         self.current_index = 0
+        self._response_stack = []
         self.scorer.reset()
         
         return session_id
     
-    def _select_questions(self, config: Dict) -> List[Dict]:
+    def _set_questions(self, questions: List[Dict]):
+        """
+        Set the questions for the current test and rebuild derived lookups.
+        
+        Args:
+            questions: Questions in the order they will be asked
+        """
+        self.questions = questions
+        self._questions_by_id = {q['id']: q for q in questions}
+        self._dim_question_counts = Counter(q['dimension'] for q in questions)
+    
+    def _select_questions(self, test_length: str) -> List[Dict]:
         """
-        Select questions based on test configuration.
+        Select questions for a test length in a fresh random order.
         
         Args:
-            config: Test configuration dictionary
+            test_length: Type of test (short/medium/long)
             
         Returns:
             List of selected questions
         """
+        selection = self._get_question_selection(test_length)
+        
+        # Shuffle questions for better test experience; sample() builds the
+        # shuffled list directly from the cached tuple
+        return random.sample(selection, len(selection))
+    
+    def _get_question_selection(self, test_length: str) -> Tuple[Dict, ...]:
+        """
+        Get the unshuffled question selection for a test length.
+        
+        The selection only depends on the question bank and test
+        configuration, so it is computed once per test length.
+        
+        Args:
+            test_length: Type of test (short/medium/long)
+            
+        Returns:
+            Selected questions grouped by dimension in priority order
+        """
+        cached = self._selection_cache.get(test_length)
+        if cached is not None:
+            return cached
+        
+        config = TEST_CONFIGS[test_length]
         selected = []
         questions_per_dim = config['questions_per_dimension']
-        priorities = config['priorities']
+        priorities = frozenset(config['priorities'])
         
         # Select questions for each dimension
-        for dimension in ['E_I', 'S_N', 'T_F', 'J_P']:
-            dim_questions = [
-                q for q in self.all_questions 
-                if q['dimension'] == dimension and q['priority'] in priorities
-            ]
-            
-            # Sort by priority to ensure we get the most important questions
-            dim_questions.sort(key=lambda x: x['priority'])
+        for dimension in DIMENSION_KEYS:
+            # Already sorted by priority so we get the most important questions
+            by_priority = self._by_dim.get(dimension, ())
+            dim_questions = [q for q in by_priority if q['priority'] in priorities]
             
             # Take the required number of questions
-            if len(dim_questions) >= questions_per_dim:
-                selected.extend(dim_questions[:questions_per_dim])
-            else:
-                # If not enough questions, take what we have
-                selected.extend(dim_questions)
-                # Fill with lower priority questions if needed
-                remaining = questions_per_dim - len(dim_questions)
-                other_dim_questions = [
-                    q for q in self.all_questions 
-                    if q['dimension'] == dimension and q not in dim_questions
-                ][:remaining]
-                selected.extend(other_dim_questions)
-        
-        # Shuffle questions for better test experience
-        # But keep some structure - group by dimension pairs
-        random.shuffle(selected)
-        
-        return selected
+            selected.extend(dim_questions[:questions_per_dim])
+            
+            # Fill with questions outside the configured priorities if needed
+            remaining = questions_per_dim - len(dim_questions)
+            if remaining > 0:
+                selected.extend(
+                    [q for q in by_priority if q['priority'] not in priorities][:remaining]
+                )
+        
+        cached = self._selection_cache[test_length] = tuple(selected)
+        return cached
     
     def resume_test(self, session_id: str) -> bool:
         """
@@ -120,18 +186,21 @@ class TestEngine:
         self.current_index = session_data['current_question']
         self.is_resuming = True
         
-        # Reload questions
-        config = TEST_CONFIGS[self.test_length]
-        self.questions = self._select_questions(config)
+        # Reload questions in the order they were originally asked
+        question_order = session_data.get('question_order')
+        if question_order:
+            by_id = {q['id']: q for q in self._get_question_selection(self.test_length)}
+            self._set_questions([by_id[qid] for qid in question_order if qid in by_id])
+        else:
+            # Sessions saved before the order was recorded
+            self._set_questions(self._select_questions(self.test_length))
         
         # Reload previous responses into scorer
         self.scorer.reset()
+        self._response_stack = [r['question_id'] for r in session_data['responses']]
         for response in session_data['responses']:
             # Find the original question
-            question = next(
-                (q for q in self.questions if q['id'] == response['question_id']), 
-                None
-            )
+            question = self._questions_by_id.get(response['question_id'])
             if question:
                 self.scorer.add_response(
                     response['question_id'],
@@ -165,7 +234,7 @@ class TestEngine:
         """
         # Validate response
         try:
-            response_value = self.validator.sanitize_response(response_value)
+            response_value = self.validator.parse_response(response_value)
             self.validator.validate_response(response_value)
         except ValueError as e:
             print(f"Invalid response: {e}")
@@ -178,6 +247,7 @@ class TestEngine:
         
         # Add to scorer
         self.scorer.add_response(question['id'], question, response_value)
+        self._response_stack.append(question['id'])
         
         # Save to session
         self.session_manager.add_response(question['id'], question, response_value)
@@ -187,6 +257,43 @@ class TestEngine:
         
         return True
     
+    def submit_responses(self, response_values: List[int]) -> int:
+        """
+        Submit responses for consecutive questions, saving the session once.
+        
+        Nothing is recorded if any value is invalid. Values beyond the
+        last question are ignored.
+        
+        Args:
+            response_values: User's responses (1-5) in question order
+            
+        Returns:
+            Number of responses recorded
+        """
+        # Validate the whole batch up front
+        try:
+            values = []
+            for response_value in response_values:
+                response_value = self.validator.parse_response(response_value)
+                self.validator.validate_response(response_value)
+                values.append(response_value)
+        except ValueError as e:
+            print(f"Invalid response: {e}")
+            return 0
+        
+        answered = []
+        for response_value in values[:len(self.questions) - self.current_index]:
+            question = self.questions[self.current_index]
+            self.scorer.add_response(question['id'], question, response_value)
+            self._response_stack.append(question['id'])
+            answered.append((question['id'], question, response_value))
+            self.current_index += 1
+        
+        if answered:
+            self.session_manager.add_responses(answered)
+        
+        return len(answered)
+    
     def go_back(self) -> bool:
         """
         Go back to the previous question.
@@ -199,7 +306,8 @@ class TestEngine:
             self.session_manager.go_back()
             
             # Remove last response from scorer
-            # This is simplified - in production would need better tracking
+            if self._response_stack:
+                self.scorer.remove_response(self._response_stack.pop())
             return True
         
         return False
@@ -235,15 +343,10 @@ class TestEngine:
         
         # Add dimension progress
         dimension_progress = {}
-        for dim in ['E_I', 'S_N', 'T_F', 'J_P']:
-            answered = sum(
-                1 for r in self.scorer.responses.values() 
-                if r['dimension'] == dim
-            )
-            total = sum(1 for q in self.questions if q['dimension'] == dim)
+        for dim in DIMENSION_KEYS:
             dimension_progress[dim] = {
-                'answered': answered,
-                'total': total,
+                'answered': self.scorer.get_response_count(dim),
+                'total': self._dim_question_counts[dim],
                 'name': DIMENSIONS[dim]['name']
             }
         
@@ -290,8 +393,7 @@ class TestEngine:
         Returns:
             Tuple of (is_valid, message)
         """
-        responses = list(self.scorer.responses.values())
-        return self.validator.check_consistency(responses)
+        return self.validator.check_consistency(self.scorer.get_response_values())
     
     def get_question_by_index(self, index: int) -> Optional[Dict]:
         """
@@ -320,6 +422,10 @@ class TestEngine:
         """Clean up old session files."""
         self.session_manager.cleanup_old_sessions()
     
+    def close(self):
+        """Save any batched answers and release the session manager."""
+        self.session_manager.close()
+    
     def export_results(self, format: str = 'json') -> Optional[str]:
         """
         Export test results.
@@ -1,4 +1,18 @@
+import re
+from collections import Counter
 from typing import List, Tuple, Dict
+from config.settings import DIMENSION_KEYS
+
+# Whole-string integers such as "3" or " -2 "
+_INTEGER_RE = re.compile(r'\s*[+-]?\d+\s*')
+# Leading digit of formatted choices like "1️⃣  Strongly Agree"
+_LEADING_DIGITS = {str(d): d for d in range(10)}
+
+_REQUIRED_QUESTION_FIELDS = frozenset({'id', 'dimension', 'text', 'type', 'priority', 'options'})
+_VALID_DIMENSIONS = frozenset(DIMENSION_KEYS)
+_VALID_PRIORITIES = frozenset({1, 2, 3})
+# Likert scale shared by responses and question options
+_VALID_VALUES = frozenset({1, 2, 3, 4, 5})
 
 class ResponseValidator:
     """Validate user responses and data integrity."""
@@ -16,7 +30,7 @@ class ResponseValidator:
         """
         if not isinstance(response_value, int):
             raise ValueError("Response must be an integer")
-        if response_value not in range(1, 6):
+        if response_value not in _VALID_VALUES:
             raise ValueError("Response must be between 1-5")
         return True
     
@@ -26,7 +40,7 @@ class ResponseValidator:
         Check for response patterns indicating low quality.
         
         Args:
-            responses: List of response dictionaries
+            responses: List of response dictionaries or raw values
             
         Returns:
             Tuple of (is_valid, message)
@@ -34,30 +48,26 @@ class ResponseValidator:
         if not responses:
             return False, "No responses provided"
         
-        values = [r.get('value', r) for r in responses]
+        values = [r.get('value', r) if isinstance(r, dict) else r for r in responses]
         
         # Check minimum responses
         if len(values) < 10:
             return True, "Too few responses to check consistency"
         
+        # Tally once; the distribution checks below all read from it
+        value_counts = Counter(values)
+        
         # Check for straight-lining (all same answer)
-        unique_values = set(values)
-        if len(unique_values) == 1:
+        if len(value_counts) == 1:
             return False, "All responses are identical - possible straight-lining"
         
-        # Check for alternating pattern
-        is_alternating = True
-        if len(values) >= 4:
-            for i in range(2, len(values)):
-                if values[i] != values[i-2]:
-                    is_alternating = False
-                    break
-        
-        if is_alternating and len(unique_values) == 2:
+        # Check for alternating pattern: every value repeats two positions later.
+        # Only possible with exactly two distinct answers, so skip the scan otherwise
+        if len(value_counts) == 2 and values[2:] == values[:-2]:
             return False, "Alternating pattern detected - possible random responses"
         
         # Check for too many extreme responses
-        extreme_count = sum(1 for v in values if v in [1, 5])
+        extreme_count = value_counts[1] + value_counts[5]
         extreme_ratio = extreme_count / len(values)
         
         if extreme_ratio > 0.9:
@@ -79,29 +89,27 @@ class ResponseValidator:
         Returns:
             Tuple of (is_valid, message)
         """
-        required_fields = ['id', 'dimension', 'text', 'type', 'priority', 'options']
-        
-        for field in required_fields:
-            if field not in question:
-                return False, f"Missing required field: {field}"
+        missing = _REQUIRED_QUESTION_FIELDS - question.keys()
+        if missing:
+            plural = 's' if len(missing) > 1 else ''
+            return False, f"Missing required field{plural}: {', '.join(sorted(missing))}"
         
         # Validate dimension
-        valid_dimensions = ['E_I', 'S_N', 'T_F', 'J_P']
-        if question['dimension'] not in valid_dimensions:
+        if question['dimension'] not in _VALID_DIMENSIONS:
             return False, f"Invalid dimension: {question['dimension']}"
         
         # Validate priority
-        if question['priority'] not in [1, 2, 3]:
+        if question['priority'] not in _VALID_PRIORITIES:
             return False, f"Invalid priority: {question['priority']}"
         
         # Validate options
-        if not isinstance(question['options'], list) or len(question['options']) != 5:
+        if not isinstance(question['options'], (list, tuple)) or len(question['options']) != 5:
             return False, "Options must be a list of 5 items"
         
         for option in question['options']:
             if 'text' not in option or 'value' not in option:
                 return False, "Each option must have 'text' and 'value' fields"
-            if option['value'] not in range(1, 6):
+            if option['value'] not in _VALID_VALUES:
                 return False, f"Invalid option value: {option['value']}"
         
         return True, "Valid question data"
@@ -128,55 +136,55 @@ class ResponseValidator:
             return False, f"Too many responses: expected {expected_count}, got {actual_count}"
         
         # Check dimension balance
-        dimension_counts = {'E_I': 0, 'S_N': 0, 'T_F': 0, 'J_P': 0}
-        
-        for response in responses.values():
-            if 'dimension' in response:
-                dim = response['dimension']
-                if dim in dimension_counts:
-                    dimension_counts[dim] += 1
+        dimension_counts = Counter(r.get('dimension') for r in responses.values())
+        counts = [dimension_counts[dim] for dim in DIMENSION_KEYS]
         
         # Check if dimensions are reasonably balanced
-        counts = list(dimension_counts.values())
-        if counts:
-            min_count = min(counts)
-            max_count = max(counts)
-            
-            if max_count > min_count * 2:
-                return False, "Dimension imbalance detected"
+        if max(counts) > min(counts) * 2:
+            return False, "Dimension imbalance detected"
         
         return True, "Test properly completed"
     
     @staticmethod
-    def sanitize_response(response: any) -> int:
+    def parse_response(response: any) -> int:
         """
-        Sanitize and convert response to valid integer.
+        Convert a raw response to an integer, without range checks.
         
         Args:
             response: Raw response value
             
         Returns:
-            Sanitized integer value
+            Integer value, raises ValueError if it can't be parsed
         """
         # Handle string numbers
         if isinstance(response, str):
-            try:
-                response = int(response)
-            except ValueError:
-                # Try to extract number from string like "1️⃣  Strongly Agree"
-                if response and response[0].isdigit():
-                    response = int(response[0])
-                else:
-                    raise ValueError(f"Cannot parse response: {response}")
+            if _INTEGER_RE.fullmatch(response):
+                return int(response)
+            if response[:1] in _LEADING_DIGITS:
+                # Extract number from string like "1️⃣  Strongly Agree"
+                return _LEADING_DIGITS[response[0]]
+            raise ValueError(f"Cannot parse response: {response}")
         
         # Handle float
         if isinstance(response, float):
-            response = round(response)
+            return round(response)
+        
+        # None, lists and the like would otherwise fail later with a TypeError
+        if not isinstance(response, int):
+            raise ValueError(f"Cannot parse response: {response!r}")
         
-        # Validate range
-        if response < 1:
-            response = 1
-        elif response > 5:
-            response = 5
+        return response
+    
+    @staticmethod
+    def sanitize_response(response: any) -> int:
+        """
+        Sanitize and convert response to valid integer.
         
-        return int(response)
\ No newline at end of file
+        Args:
+            response: Raw response value
+            
+        Returns:
+            Sanitized integer value, raises ValueError if it can't be parsed
+        """
+        # Clamp to valid range
+        return min(5, max(1, ResponseValidator.parse_response(response)))
\ No newline at end of file
@@ -1,14 +1,31 @@
-import plotext as plt
-from rich.console import Console
+from bisect import bisect_left
 from rich.panel import Panel
 from rich.table import Table
-from typing import Dict
+from rich.text import Text
+from typing import Dict, List, Tuple
+from config.settings import DIMENSION_KEYS, SETTINGS
+from ui.themes import console
 
-console = Console()
+_COLOR_MAP = {
+    'E_I': 'cyan',
+    'S_N': 'magenta',
+    'T_F': 'yellow',
+    'J_P': 'green'
+}
+
+# Codes on the right side of each dimension (E, N, T, J)
+_RIGHT_CODES = frozenset({'E', 'N', 'T', 'J'})
+# Bar styles by strength: up to 55%, up to 70%, above 70%
+_STYLE_THRESHOLDS = (55, 70)
+_STRENGTH_STYLES = ("muted", "warning", "success")
 
 class Charts:
     """Terminal-based charts and visualizations."""
     
+    # Sliced to build bars without repeating characters on every call
+    _BAR_FULL = "█" * 50
+    _BAR_EMPTY = "░" * 50
+    
     @staticmethod
     def create_dimension_chart(dimension_scores: Dict):
         """
@@ -17,34 +34,52 @@ class Charts:
         Args:
             dimension_scores: Dictionary of dimension scores
         """
-        # Clear any previous plot data
-        plt.clear_data()
-        plt.clear_color()
+        # Label and score of the side that won, in dimension order
+        rows = []
+        for dim_key in DIMENSION_KEYS:
+            score = dimension_scores[dim_key]
+            if score['preference'] in _RIGHT_CODES:
+                rows.append((dim_key, score['right_label'], score['right_score']))
+            else:
+                rows.append((dim_key, score['left_label'], score['left_score']))
         
-        # Prepare data
-        dimensions = []
-        scores = []
-        colors = []
+        if SETTINGS['plot_charts']:
+            Charts._plot_dimension_chart(rows)
         
-        color_map = {
-            'E_I': 'cyan',
-            'S_N': 'magenta',
-            'T_F': 'yellow',
-            'J_P': 'green'
-        }
+        # ASCII bar chart
+        console.print("\n[primary]Dimension Strengths:[/primary]\n")
         
-        for dim_key in ['E_I', 'S_N', 'T_F', 'J_P']:
-            score = dimension_scores[dim_key]
+        for _, label, strength in rows:
+            # Create bar
+            bar_length = int(strength / 2)  # Max 50 chars
+            bar = Charts._BAR_FULL[:bar_length] + Charts._BAR_EMPTY[bar_length:]
             
-            # Show the preferred side
-            if score['preference'] in ['E', 'N', 'T', 'J']:
-                dimensions.append(score['right_label'][:3])  # Abbreviate for space
-                scores.append(score['right_score'])
-            else:
-                dimensions.append(score['left_label'][:3])
-                scores.append(score['left_score'])
+            # Color based on strength
+            style = _STRENGTH_STYLES[bisect_left(_STYLE_THRESHOLDS, strength)]
             
-            colors.append(color_map.get(dim_key, 'white'))
+            console.print(f"{label:15} [{style}][{bar}][/{style}] {strength:.1f}%")
+    
+    @staticmethod
+    def _plot_dimension_chart(rows: List[Tuple[str, str, float]]):
+        """
+        Draw the dimensions as a plotext bar chart, if plotext is installed.
+        
+        Args:
+            rows: (dimension key, preferred label, preferred score) per dimension
+        """
+        try:
+            import plotext as plt
+        except ImportError:
+            return
+        
+        # Clear any previous plot data
+        plt.clear_data()
+        plt.clear_color()
+        
+        # Prepare data, showing the preferred side
+        dimensions = [label[:3] for _, label, _ in rows]  # Abbreviate for space
+        scores = [strength for _, _, strength in rows]
+        colors = [_COLOR_MAP.get(dim_key, 'white') for dim_key, _, _ in rows]
         
         # Create bar chart
         plt.bar(dimensions, scores)
@@ -57,36 +92,9 @@ class Charts:
         plt.theme('dark')
         plt.plotsize(60, 15)
         
-        # Show the plot
-        plt.show()
-        
-        # Alternative: Create ASCII bar chart
-        console.print("\n[primary]Dimension Strengths:[/primary]\n")
-        
-        for dim_key in ['E_I', 'S_N', 'T_F', 'J_P']:
-            score = dimension_scores[dim_key]
-            
-            # Determine which side won
-            if score['preference'] in ['E', 'N', 'T', 'J']:
-                label = score['right_label']
-                strength = score['right_score']
-            else:
-                label = score['left_label']
-                strength = score['left_score']
-            
-            # Create bar
-            bar_length = int(strength / 2)  # Max 50 chars
-            bar = "█" * bar_length + "░" * (50 - bar_length)
-            
-            # Color based on strength
-            if strength > 70:
-                style = "success"
-            elif strength > 55:
-                style = "warning"
-            else:
-                style = "muted"
-            
-            console.print(f"{label:15} [{style}][{bar}][/{style}] {strength:.1f}%")
+        # Render through the console so it is captured with the rest of
+        # the dashboard instead of going straight to stdout
+        console.print(Text.from_ansi(plt.build()))
     
     @staticmethod
     def create_comparison_chart(dimension_scores: Dict):
@@ -103,7 +111,7 @@ class Charts:
         table.add_column("→", style="dim", width=25)
         table.add_column("", style="cyan", width=15)
         
-        for dim_key in ['E_I', 'S_N', 'T_F', 'J_P']:
+        for dim_key in DIMENSION_KEYS:
             score = dimension_scores[dim_key]
             
             left_score = score['left_score']
@@ -1,13 +1,27 @@
-import pyfiglet
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.columns import Columns
 from rich import box
+from functools import lru_cache
+from itertools import zip_longest
 from typing import Dict
 from display.charts import Charts
+from display.type_banners import BANNERS
+from config.settings import DIMENSION_KEYS
+from ui.themes import console
 
-console = Console()
+@lru_cache(maxsize=None)
+def _figlet():
+    """
+    Build the pyfiglet renderer once; loading a font parses its .flf file.
+    
+    Returns:
+        Figlet instance, or None if pyfiglet is not installed
+    """
+    try:
+        import pyfiglet
+    except ImportError:
+        return None
+    return pyfiglet.Figlet(font="standard")
 
 class Reports:
     """Generate and display test results reports."""
@@ -20,54 +34,65 @@ class Reports:
         Args:
             results: Complete results dictionary
         """
-        console.clear()
-        
-        # Get data
-        mbti_type = results['mbti_type']
-        dimension_scores = results['dimension_scores']
-        personality_analysis = results.get('personality_analysis', {})
-        
-        # 1. Type reveal with ASCII art
-        Reports._display_type_reveal(mbti_type, personality_analysis.get('title', ''))
-        
-        # 2. Confidence meter
-        Charts.create_confidence_meter(results['confidence'])
-        console.print()
-        
-        # 3. Dimension visualization
-        console.rule("[primary]Personality Dimensions[/primary]")
-        Charts.create_dimension_chart(dimension_scores)
-        console.print()
-        
-        # 4. Dimension comparison
-        Charts.create_comparison_chart(dimension_scores)
-        console.print()
-        
-        # 5. Personality overview
-        if personality_analysis:
-            Reports._display_personality_overview(personality_analysis)
-        
-        # 6. Strengths and weaknesses
-        if 'strengths' in personality_analysis and 'weaknesses' in personality_analysis:
-            Reports._display_strengths_weaknesses(personality_analysis)
-        
-        # 7. Cognitive functions
-        if 'cognitive_stack' in personality_analysis:
-            console.rule("[primary]Cognitive Functions[/primary]")
-            Charts.create_cognitive_stack_display(personality_analysis['cognitive_stack'])
+        # Render the whole dashboard into one buffer and write it in a
+        # single call rather than flushing after every panel. The clear is
+        # buffered too, so the screen is wiped and redrawn in the same write
+        with console.capture() as capture:
+            console.clear()
+            
+            # Get data
+            mbti_type = results['mbti_type']
+            dimension_scores = results['dimension_scores']
+            personality_analysis = results.get('personality_analysis', {})
+            cognitive_stack = personality_analysis.get('cognitive_stack')
+            career_matches = personality_analysis.get('career_matches')
+            famous_examples = personality_analysis.get('famous_examples')
+            test_metadata = results.get('test_metadata')
+            
+            # 1. Type reveal with ASCII art
+            Reports._display_type_reveal(mbti_type, personality_analysis.get('title', ''))
+            
+            # 2. Confidence meter
+            Charts.create_confidence_meter(results['confidence'])
             console.print()
+            
+            # 3. Dimension visualization
+            console.rule("[primary]Personality Dimensions[/primary]")
+            Charts.create_dimension_chart(dimension_scores)
+            console.print()
+            
+            # 4. Dimension comparison
+            Charts.create_comparison_chart(dimension_scores)
+            console.print()
+            
+            # 5. Personality overview
+            if personality_analysis:
+                Reports._display_personality_overview(personality_analysis)
+            
+            # 6. Strengths and weaknesses
+            if 'strengths' in personality_analysis and 'weaknesses' in personality_analysis:
+                Reports._display_strengths_weaknesses(personality_analysis)
+            
+            # 7. Cognitive functions
+            if cognitive_stack is not None:
+                console.rule("[primary]Cognitive Functions[/primary]")
+                Charts.create_cognitive_stack_display(cognitive_stack)
+                console.print()
+            
+            # 8. Career matches
+            if career_matches is not None:
+                Reports._display_career_matches(career_matches)
+            
+            # 9. Famous examples
+            if famous_examples is not None:
+                Reports._display_famous_examples(famous_examples)
+            
+            # 10. Test metadata
+            if test_metadata is not None:
+                Reports._display_test_metadata(test_metadata)
         
-        # 8. Career matches
-        if 'career_matches' in personality_analysis:
-            Reports._display_career_matches(personality_analysis['career_matches'])
-        
-        # 9. Famous examples
-        if 'famous_examples' in personality_analysis:
-            Reports._display_famous_examples(personality_analysis['famous_examples'])
-        
-        # 10. Test metadata
-        if 'test_metadata' in results:
-            Reports._display_test_metadata(results['test_metadata'])
+        console.file.write(capture.get())
+        console.file.flush()
     
     @staticmethod
     def _display_type_reveal(mbti_type: str, title: str):
@@ -75,7 +100,11 @@ class Reports:
         console.rule()
         
         # ASCII art for the type
-        type_ascii = pyfiglet.figlet_format(mbti_type, font="standard")
+        type_ascii = BANNERS.get(mbti_type)
+        if type_ascii is None:
+            # Codes outside the 16 types (e.g. with an undetermined 'X')
+            figlet = _figlet()
+            type_ascii = figlet.renderText(mbti_type) if figlet else mbti_type
         console.print(f"[primary]{type_ascii}[/primary]", justify="center")
         
         if title:
@@ -102,13 +131,13 @@ class Reports:
         """Display strengths and weaknesses side by side."""
         console.rule("[primary]Strengths & Growth Areas[/primary]")
         
-        strengths_content = "\n".join([
+        strengths_content = "\n".join(
             f"• {s}" for s in personality_analysis['strengths'][:5]
-        ])
+        )
         
-        weaknesses_content = "\n".join([
+        weaknesses_content = "\n".join(
             f"• {w}" for w in personality_analysis['weaknesses'][:5]
-        ])
+        )
         
         strengths_panel = Panel(
             strengths_content,
@@ -124,7 +153,12 @@ class Reports:
             box=box.ROUNDED
         )
         
-        console.print(Columns([strengths_panel, weaknesses_panel], equal=True))
+        # Fixed two-column grid; cheaper to lay out than Columns' measuring pass
+        grid = Table.grid(expand=True, padding=(0, 1))
+        grid.add_column(ratio=1)
+        grid.add_column(ratio=1)
+        grid.add_row(strengths_panel, weaknesses_panel)
+        console.print(grid)
         console.print()
     
     @staticmethod
@@ -132,21 +166,17 @@ class Reports:
         """Display career matches."""
         console.rule("[primary]Career Matches[/primary]")
         
-        # Split into two columns for better display
-        mid = len(career_matches) // 2
-        col1 = career_matches[:mid]
-        col2 = career_matches[mid:]
-        
-        table = Table(show_header=False, box=None)
-        table.add_column("", style="cyan")
-        table.add_column("", style="cyan")
+        # Split into two columns for better display, odd item goes left
+        mid = (len(career_matches) + 1) // 2
+        col1 = [f"• {c}" for c in career_matches[:mid]]
+        col2 = [f"• {c}" for c in career_matches[mid:]]
         
-        for c1, c2 in zip(col1, col2):
-            table.add_row(f"• {c1}", f"• {c2}")
+        table = Table.grid(padding=(0, 2))
+        table.add_column(style="cyan")
+        table.add_column(style="cyan")
         
-        # Handle odd number of items
-        if len(col1) > len(col2):
-            table.add_row(f"• {col1[-1]}", "")
+        for c1, c2 in zip_longest(col1, col2, fillvalue=""):
+            table.add_row(c1, c2)
         
         career_panel = Panel(
             table,
@@ -201,49 +231,41 @@ Time Taken: {metadata.get('completion_time', 'Unknown')}
         mbti_type = results['mbti_type']
         dimension_scores = results['dimension_scores']
         personality_analysis = results.get('personality_analysis', {})
+        title = personality_analysis.get('title')
+        overview = personality_analysis.get('overview')
+        strengths = personality_analysis.get('strengths')
+        career_matches = personality_analysis.get('career_matches')
+        
+        rule = "=" * 60
+        divider = "-" * 40
+        
+        title_line = f"Type Title: {title}\n" if title is not None else ""
+        dimension_lines = "".join(
+            f"{dimension_scores[dim_key]['preferred_label']:20} "
+            f"{dimension_scores[dim_key]['strength']:.1f}%\n"
+            for dim_key in DIMENSION_KEYS
+        )
         
-        summary = []
-        summary.append("=" * 60)
-        summary.append("MBTI PERSONALITY TEST RESULTS")
-        summary.append("=" * 60)
-        summary.append("")
-        summary.append(f"Your Personality Type: {mbti_type}")
-        
-        if 'title' in personality_analysis:
-            summary.append(f"Type Title: {personality_analysis['title']}")
-        
-        summary.append(f"Overall Confidence: {results['confidence']:.1f}%")
-        summary.append("")
-        
-        summary.append("DIMENSION SCORES:")
-        summary.append("-" * 40)
-        
-        for dim_key in ['E_I', 'S_N', 'T_F', 'J_P']:
-            score = dimension_scores[dim_key]
-            summary.append(f"{score['preferred_label']:20} {score['strength']:.1f}%")
-        
-        summary.append("")
-        
-        if 'overview' in personality_analysis:
-            summary.append("PERSONALITY OVERVIEW:")
-            summary.append("-" * 40)
-            summary.append(personality_analysis['overview'])
-            summary.append("")
-        
-        if 'strengths' in personality_analysis:
-            summary.append("STRENGTHS:")
-            summary.append("-" * 40)
-            for strength in personality_analysis['strengths']:
-                summary.append(f"• {strength}")
-            summary.append("")
-        
-        if 'career_matches' in personality_analysis:
-            summary.append("RECOMMENDED CAREERS:")
-            summary.append("-" * 40)
-            for career in personality_analysis['career_matches'][:8]:
-                summary.append(f"• {career}")
-            summary.append("")
-        
-        summary.append("=" * 60)
-        
-        return "\n".join(summary)
\ No newline at end of file
+        overview_section = ""
+        if overview is not None:
+            overview_section = f"PERSONALITY OVERVIEW:\n{divider}\n{overview}\n\n"
+        
+        strengths_section = ""
+        if strengths is not None:
+            bullets = "".join(f"• {s}\n" for s in strengths)
+            strengths_section = f"STRENGTHS:\n{divider}\n{bullets}\n"
+        
+        careers_section = ""
+        if career_matches is not None:
+            bullets = "".join(f"• {c}\n" for c in career_matches[:8])
+            careers_section = f"RECOMMENDED CAREERS:\n{divider}\n{bullets}\n"
+        
+        return (
+            f"{rule}\nMBTI PERSONALITY TEST RESULTS\n{rule}\n\n"
+            f"Your Personality Type: {mbti_type}\n"
+            f"{title_line}"
+            f"Overall Confidence: {results['confidence']:.1f}%\n\n"
+            f"DIMENSION SCORES:\n{divider}\n{dimension_lines}\n"
+            f"{overview_section}{strengths_section}{careers_section}"
+            f"{rule}"
+        )
\ No newline at end of file
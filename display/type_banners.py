@@ -0,0 +1,156 @@
+"""
+ASCII-art banners for the 16 personality types.
+
+Pre-rendered with pyfiglet's "standard" font so the results screen
+doesn't have to parse font files and lay out glyphs at runtime.
+Regenerate with:
+
+    pyfiglet.figlet_format(mbti_type, font="standard")
+"""
+
+BANNERS = {
+    'INTJ': '\n'.join((
+        ' ___ _   _ _____   _ ',
+        '|_ _| \\ | |_   _| | |',
+        ' | ||  \\| | | |_  | |',
+        ' | || |\\  | | | |_| |',
+        '|___|_| \\_| |_|\\___/ ',
+        '                     ',
+        '',
+    )),
+    'INTP': '\n'.join((
+        ' ___ _   _ _____ ____  ',
+        '|_ _| \\ | |_   _|  _ \\ ',
+        ' | ||  \\| | | | | |_) |',
+        ' | || |\\  | | | |  __/ ',
+        '|___|_| \\_| |_| |_|    ',
+        '                       ',
+        '',
+    )),
+    'ENTJ': '\n'.join((
+        ' _____ _   _ _____   _ ',
+        '| ____| \\ | |_   _| | |',
+        '|  _| |  \\| | | |_  | |',
+        '| |___| |\\  | | | |_| |',
+        '|_____|_| \\_| |_|\\___/ ',
+        '                       ',
+        '',
+    )),
+    'ENTP': '\n'.join((
+        ' _____ _   _ _____ ____  ',
+        '| ____| \\ | |_   _|  _ \\ ',
+        '|  _| |  \\| | | | | |_) |',
+        '| |___| |\\  | | | |  __/ ',
+        '|_____|_| \\_| |_| |_|    ',
+        '                         ',
+        '',
+    )),
+    'INFJ': '\n'.join((
+        ' ___ _   _ _____   _ ',
+        '|_ _| \\ | |  ___| | |',
+        ' | ||  \\| | |_ _  | |',
+        ' | || |\\  |  _| |_| |',
+        '|___|_| \\_|_|  \\___/ ',
+        '                     ',
+        '',
+    )),
+    'INFP': '\n'.join((
+        ' ___ _   _ _____ ____  ',
+        '|_ _| \\ | |  ___|  _ \\ ',
+        ' | ||  \\| | |_  | |_) |',
+        ' | || |\\  |  _| |  __/ ',
+        '|___|_| \\_|_|   |_|    ',
+        '                       ',
+        '',
+    )),
+    'ENFJ': '\n'.join((
+        ' _____ _   _ _____   _ ',
+        '| ____| \\ | |  ___| | |',
+        '|  _| |  \\| | |_ _  | |',
+        '| |___| |\\  |  _| |_| |',
+        '|_____|_| \\_|_|  \\___/ ',
+        '                       ',
+        '',
+    )),
+    'ENFP': '\n'.join((
+        ' _____ _   _ _____ ____  ',
+        '| ____| \\ | |  ___|  _ \\ ',
+        '|  _| |  \\| | |_  | |_) |',
+        '| |___| |\\  |  _| |  __/ ',
+        '|_____|_| \\_|_|   |_|    ',
+        '                         ',
+        '',
+    )),
+    'ISTJ': '\n'.join((
+        ' ___ ____ _____   _ ',
+        '|_ _/ ___|_   _| | |',
+        ' | |\\___ \\ | |_  | |',
+        ' | | ___) || | |_| |',
+        '|___|____/ |_|\\___/ ',
+        '                    ',
+        '',
+    )),
+    'ISFJ': '\n'.join((
+        ' ___ ____  _____   _ ',
+        '|_ _/ ___||  ___| | |',
+        ' | |\\___ \\| |_ _  | |',
+        ' | | ___) |  _| |_| |',
+        '|___|____/|_|  \\___/ ',
+        '                     ',
+        '',
+    )),
+    'ESTJ': '\n'.join((
+        ' _____ ____ _____   _ ',
+        '| ____/ ___|_   _| | |',
+        '|  _| \\___ \\ | |_  | |',
+        '| |___ ___) || | |_| |',
+        '|_____|____/ |_|\\___/ ',
+        '                      ',
+        '',
+    )),
+    'ESFJ': '\n'.join((
+        ' _____ ____  _____   _ ',
+        '| ____/ ___||  ___| | |',
+        '|  _| \\___ \\| |_ _  | |',
+        '| |___ ___) |  _| |_| |',
+        '|_____|____/|_|  \\___/ ',
+        '                       ',
+        '',
+    )),
+    'ISTP': '\n'.join((
+        ' ___ ____ _____ ____  ',
+        '|_ _/ ___|_   _|  _ \\ ',
+        ' | |\\___ \\ | | | |_) |',
+        ' | | ___) || | |  __/ ',
+        '|___|____/ |_| |_|    ',
+        '                      ',
+        '',
+    )),
+    'ISFP': '\n'.join((
+        ' ___ ____  _____ ____  ',
+        '|_ _/ ___||  ___|  _ \\ ',
+        ' | |\\___ \\| |_  | |_) |',
+        ' | | ___) |  _| |  __/ ',
+        '|___|____/|_|   |_|    ',
+        '                       ',
+        '',
+    )),
+    'ESTP': '\n'.join((
+        ' _____ ____ _____ ____  ',
+        '| ____/ ___|_   _|  _ \\ ',
+        '|  _| \\___ \\ | | | |_) |',
+        '| |___ ___) || | |  __/ ',
+        '|_____|____/ |_| |_|    ',
+        '                        ',
+        '',
+    )),
+    'ESFP': '\n'.join((
+        ' _____ ____  _____ ____  ',
+        '| ____/ ___||  ___|  _ \\ ',
+        '|  _| \\___ \\| |_  | |_) |',
+        '| |___ ___) |  _| |  __/ ',
+        '|_____|____/|_|   |_|    ',
+        '                         ',
+        '',
+    ))
+}
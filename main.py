@@ -7,17 +7,12 @@ A comprehensive Myers-Briggs Type Indicator assessment tool
 import sys
 from pathlib import Path
 from typing import Dict, Optional
-import questionary
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core.test_engine import TestEngine
-from ui.components import UIComponents
-from ui.animations import Animations
-from ui.themes import console
-from display.reports import Reports
-from utils.exporter import Exporter
+# UI, display and export modules pull in rich, questionary and pyfiglet, so
+# they are imported where first needed to keep --version/--disclaimer fast
 from utils.helpers import (
     ensure_terminal_size, 
     validate_data_files,
@@ -30,6 +25,11 @@ class MBTIApp:
     """Main application class for MBTI test."""
     
     def __init__(self):
+        from core.test_engine import TestEngine
+        from ui.components import UIComponents
+        from ui.themes import console
+        
+        self.console = console
         self.test_engine = TestEngine()
         self.ui = UIComponents()
         self.current_session_id = None
@@ -39,14 +39,14 @@ class MBTIApp:
         try:
             # Check terminal size
             if not ensure_terminal_size(SETTINGS['min_terminal_width']):
-                console.print(
+                self.console.print(
                     f"[error]Terminal width must be at least {SETTINGS['min_terminal_width']} columns[/error]"
                 )
                 return
             
             # Validate data files
             if not validate_data_files():
-                console.print("[error]Required data files not found. Please ensure all files are present.[/error]")
+                self.console.print("[error]Required data files not found. Please ensure all files are present.[/error]")
                 return
             
             # Clean up old sessions
@@ -76,20 +76,28 @@ class MBTIApp:
         except KeyboardInterrupt:
             self.handle_interrupt()
         except Exception as e:
-            console.print(f"[error]An unexpected error occurred: {e}[/error]")
+            self.console.print(f"[error]An unexpected error occurred: {e}[/error]")
             sys.exit(1)
+        finally:
+            # Also runs on the sys.exit calls above
+            self.test_engine.close()
     
     def start_new_test(self):
         """Start a new test session."""
+        from ui.animations import Animations
+        
         # Select test length
         test_length = self.ui.select_test_length()
         
         if not test_length:
             return
         
-        # Initialize test
-        Animations.loading_spinner("Preparing your test...", 1)
-        self.current_session_id = self.test_engine.initialize_test(test_length)
+        # Initialize test while the spinner is up
+        self.current_session_id = Animations.animated_task(
+            lambda: self.test_engine.initialize_test(test_length),
+            "Preparing your test...",
+            min_duration=1
+        )
         
         # Run test
         self.run_test(resuming=False)
@@ -102,7 +110,7 @@ class MBTIApp:
             resuming: Whether resuming a previous session
         """
         if resuming:
-            console.print("\n[primary]Resuming your test...[/primary]\n")
+            self.console.print("\n[primary]Resuming your test...[/primary]\n")
         
         # Main test loop
         while not self.test_engine.is_complete():
@@ -125,7 +133,7 @@ class MBTIApp:
             if response is None:
                 # User wants to quit
                 if self.ui.confirm_action("Save progress and quit?"):
-                    console.print("[success]Progress saved. You can resume later.[/success]")
+                    self.console.print("[success]Progress saved. You can resume later.[/success]")
                     return
                 else:
                     continue
@@ -138,7 +146,10 @@ class MBTIApp:
     
     def show_results(self):
         """Calculate and display test results."""
-        console.clear()
+        from ui.animations import Animations
+        from display.reports import Reports
+        
+        self.console.clear()
         
         # Validate responses
         is_valid, message = self.test_engine.validate_responses()
@@ -148,8 +159,11 @@ class MBTIApp:
                 return
         
         # Calculate results with animation
-        Animations.loading_spinner("Analyzing your responses...", 2)
-        results = self.test_engine.calculate_results()
+        results = Animations.animated_task(
+            self.test_engine.calculate_results,
+            "Analyzing your responses...",
+            min_duration=2
+        )
         
         # Reveal type dramatically
         Animations.reveal_result(results['mbti_type'])
@@ -161,10 +175,10 @@ class MBTIApp:
         self.offer_export(results)
         
         # Show disclaimer
-        console.print("\n[dim]Note: This is not a clinical assessment.[/dim]")
+        self.console.print("\n[dim]Note: This is not a clinical assessment.[/dim]")
         
         # Ask if user wants to take another test
-        console.print("\n")
+        self.console.print("\n")
         if self.ui.confirm_action("Would you like to take another test?"):
             # Reset the app state and start fresh instead of recursive call
             self.__init__()
@@ -177,8 +191,11 @@ class MBTIApp:
         Args:
             results: Test results dictionary
         """
-        console.print("\n")
-        console.rule("[primary]Save Your Results[/primary]")
+        import questionary
+        from utils.exporter import Exporter
+        
+        self.console.print("\n")
+        self.console.rule("[primary]Save Your Results[/primary]")
         
         choices = [
             "📄 Save as text file",
@@ -208,12 +225,12 @@ class MBTIApp:
     
     def handle_interrupt(self):
         """Handle Ctrl+C gracefully."""
-        console.print("\n[warning]Test interrupted[/warning]")
+        self.console.print("\n[warning]Test interrupted[/warning]")
         
         if self.current_session_id:
-            console.print("[success]Your progress has been automatically saved.[/success]")
+            self.console.print("[success]Your progress has been automatically saved.[/success]")
         
-        console.print("[dim]Goodbye![/dim]")
+        self.console.print("[dim]Goodbye![/dim]")
         sys.exit(0)
 
 
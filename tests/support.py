@@ -0,0 +1,13 @@
+"""
+Shared helpers for the test suites.
+"""
+
+import os
+from pathlib import Path
+
+
+def clear_dir(path: Path):
+    """Delete the files in a flat directory, leaving the directory itself."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            os.unlink(entry.path)
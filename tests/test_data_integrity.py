@@ -5,21 +5,55 @@ These tests verify that all data files are properly formatted and contain valid
 
 import unittest
 import json
+import re
+from collections import Counter
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.validator import ResponseValidator
+from utils.serialization import loads
 from config.settings import DIMENSIONS
+from display.type_banners import BANNERS
+
+_DATA_DIR = (Path(__file__).parent.parent / 'data').resolve()
+
+_TYPE_CODES = (
+    'INTJ', 'INTP', 'ENTJ', 'ENTP',
+    'INFJ', 'INFP', 'ENFJ', 'ENFP',
+    'ISTJ', 'ISFJ', 'ESTJ', 'ESFJ',
+    'ISTP', 'ISFP', 'ESTP', 'ESFP'
+)
+_FUNC_CODES = ('Ni', 'Ne', 'Si', 'Se', 'Ti', 'Te', 'Fi', 'Fe')
+# Any of the function codes above as a whole word, e.g. "Ni (Introverted Intuition)"
+_FUNC_RE = re.compile(r'\b[NSTF][ie]\b')
 
 
 class TestDataIntegrity(unittest.TestCase):
     """Test the integrity of data files."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Load the read-only data files once for every test."""
+        cls.data_dir = _DATA_DIR
+        cls.questions = loads((cls.data_dir / 'questions.json').read_bytes())
+        cls.personality_types = loads((cls.data_dir / 'personality_types.json').read_bytes())
+        cls.cognitive_functions = loads((cls.data_dir / 'cognitive_functions.json').read_bytes())
+        
+        # Aggregates shared by the question distribution/uniqueness tests
+        questions = cls.questions['questions']
+        cls.dim_counts = Counter(q['dimension'] for q in questions)
+        cls.priority_by_dim = {
+            dim: Counter(q['priority'] for q in questions if q['dimension'] == dim)
+            for dim in ('E_I', 'S_N', 'T_F', 'J_P')
+        }
+        cls.ids = [q['id'] for q in questions]
+        cls.texts = [q['text'] for q in questions]
+        cls.types = {q['type'] for q in questions}
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.data_dir = Path(__file__).parent.parent / 'data'
         self.validator = ResponseValidator()
     
     def test_data_directory_exists(self):
@@ -44,8 +78,7 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_questions_file_structure(self):
         """Test that questions.json has valid structure."""
-        with open(self.data_dir / 'questions.json') as f:
-            data = json.load(f)
+        data = self.questions
         
         self.assertIn('questions', data)
         self.assertIsInstance(data['questions'], list)
@@ -53,47 +86,28 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_questions_total_count(self):
         """Test that we have exactly 88 questions."""
-        with open(self.data_dir / 'questions.json') as f:
-            data = json.load(f)
+        data = self.questions
         
         self.assertEqual(len(data['questions']), 88)
     
     def test_questions_dimension_distribution(self):
         """Test that questions are evenly distributed across dimensions."""
-        with open(self.data_dir / 'questions.json') as f:
-            data = json.load(f)
-        
-        dimension_counts = {}
-        for question in data['questions']:
-            dim = question['dimension']
-            dimension_counts[dim] = dimension_counts.get(dim, 0) + 1
-        
         # Should have 22 questions per dimension
         for dim in ['E_I', 'S_N', 'T_F', 'J_P']:
             self.assertEqual(
-                dimension_counts.get(dim, 0),
+                self.dim_counts[dim],
                 22,
                 f"Dimension {dim} should have 22 questions"
             )
     
     def test_questions_priority_distribution(self):
         """Test that questions have proper priority distribution."""
-        with open(self.data_dir / 'questions.json') as f:
-            data = json.load(f)
-        
-        # Count priorities per dimension
         for dim in ['E_I', 'S_N', 'T_F', 'J_P']:
-            dim_questions = [q for q in data['questions'] if q['dimension'] == dim]
-            
-            priority_counts = {}
-            for q in dim_questions:
-                p = q['priority']
-                priority_counts[p] = priority_counts.get(p, 0) + 1
+            priority_counts = self.priority_by_dim[dim]
             
             # Each dimension should have questions at all priority levels
-            self.assertIn(1, priority_counts, f"Dimension {dim} missing priority 1 questions")
-            self.assertIn(2, priority_counts, f"Dimension {dim} missing priority 2 questions")
-            self.assertIn(3, priority_counts, f"Dimension {dim} missing priority 3 questions")
+            missing = {1, 2, 3} - priority_counts.keys()
+            self.assertFalse(missing, f"Dimension {dim} missing priority {sorted(missing)} questions")
             
             # Should have at least 4 priority 1 questions (for short test)
             self.assertGreaterEqual(
@@ -104,8 +118,7 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_each_question_validity(self):
         """Test that each question has valid structure and data."""
-        with open(self.data_dir / 'questions.json') as f:
-            data = json.load(f)
+        data = self.questions
         
         for i, question in enumerate(data['questions']):
             # Validate using validator
@@ -123,16 +136,12 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_question_ids_unique(self):
         """Test that all question IDs are unique."""
-        with open(self.data_dir / 'questions.json') as f:
-            data = json.load(f)
-        
-        ids = [q['id'] for q in data['questions']]
+        ids = self.ids
         self.assertEqual(len(ids), len(set(ids)), "Duplicate question IDs found")
     
     def test_question_options_valid(self):
         """Test that all question options are valid."""
-        with open(self.data_dir / 'questions.json') as f:
-            data = json.load(f)
+        data = self.questions
         
         for question in data['questions']:
             options = question['options']
@@ -152,27 +161,26 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_personality_types_structure(self):
         """Test that personality_types.json has valid structure."""
-        with open(self.data_dir / 'personality_types.json') as f:
-            data = json.load(f)
+        data = self.personality_types
         
         # Should have exactly 16 types
         self.assertEqual(len(data), 16)
         
         # Check all 16 types are present
-        expected_types = [
-            'INTJ', 'INTP', 'ENTJ', 'ENTP',
-            'INFJ', 'INFP', 'ENFJ', 'ENFP',
-            'ISTJ', 'ISFJ', 'ESTJ', 'ESFJ',
-            'ISTP', 'ISFP', 'ESTP', 'ESFP'
-        ]
-        
-        for type_code in expected_types:
+        for type_code in _TYPE_CODES:
             self.assertIn(type_code, data, f"Missing personality type: {type_code}")
     
+    def test_type_banners_cover_all_types(self):
+        """Test that every personality type has a pre-rendered banner."""
+        data = self.personality_types
+        
+        self.assertEqual(set(BANNERS), set(data))
+        for type_code, banner in BANNERS.items():
+            self.assertGreater(len(banner.strip()), 0, f"Empty banner for {type_code}")
+    
     def test_each_personality_type_complete(self):
         """Test that each personality type has all required fields."""
-        with open(self.data_dir / 'personality_types.json') as f:
-            data = json.load(f)
+        data = self.personality_types
         
         required_fields = [
             'title', 'overview', 'strengths', 'weaknesses',
@@ -201,8 +209,7 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_cognitive_functions_structure(self):
         """Test that cognitive_functions.json has valid structure."""
-        with open(self.data_dir / 'cognitive_functions.json') as f:
-            data = json.load(f)
+        data = self.cognitive_functions
         
         self.assertIn('functions', data)
         self.assertIn('stacks', data)
@@ -215,12 +222,9 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_cognitive_functions_complete(self):
         """Test that cognitive functions have all required data."""
-        with open(self.data_dir / 'cognitive_functions.json') as f:
-            data = json.load(f)
-        
-        expected_functions = ['Ni', 'Ne', 'Si', 'Se', 'Ti', 'Te', 'Fi', 'Fe']
+        data = self.cognitive_functions
         
-        for func in expected_functions:
+        for func in _FUNC_CODES:
             self.assertIn(func, data['functions'])
             func_data = data['functions'][func]
             
@@ -233,8 +237,7 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_cognitive_stacks_valid(self):
         """Test that cognitive stacks are valid for each type."""
-        with open(self.data_dir / 'cognitive_functions.json') as f:
-            data = json.load(f)
+        data = self.cognitive_functions
         
         for type_code, stack in data['stacks'].items():
             # Should have exactly 4 functions
@@ -250,27 +253,12 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_no_duplicate_questions_text(self):
         """Test that no questions have duplicate text."""
-        with open(self.data_dir / 'questions.json') as f:
-            data = json.load(f)
-        
-        texts = [q['text'] for q in data['questions']]
-        unique_texts = set(texts)
-        
-        if len(texts) != len(unique_texts):
-            # Find duplicates for better error message
-            seen = set()
-            duplicates = set()
-            for text in texts:
-                if text in seen:
-                    duplicates.add(text)
-                seen.add(text)
-            
-            self.fail(f"Duplicate question texts found: {duplicates}")
+        duplicates = [text for text, count in Counter(self.texts).items() if count > 1]
+        self.assertFalse(duplicates, f"Duplicate question texts found: {duplicates}")
     
     def test_personality_types_cognitive_stack_format(self):
         """Test that cognitive stacks in personality types are properly formatted."""
-        with open(self.data_dir / 'personality_types.json') as f:
-            data = json.load(f)
+        data = self.personality_types
         
         for type_code, type_data in data.items():
             stack = type_data['cognitive_stack']
@@ -287,28 +275,29 @@ class TestDataIntegrity(unittest.TestCase):
                 self.assertIsInstance(value, str)
                 # Should contain function code (e.g., "Ni", "Te")
                 self.assertTrue(
-                    any(func in value for func in ['Ni', 'Ne', 'Si', 'Se', 'Ti', 'Te', 'Fi', 'Fe']),
+                    _FUNC_RE.search(value),
                     f"Type {type_code} {position} function missing code"
                 )
     
     def test_json_files_valid(self):
         """Test that all JSON files are valid JSON."""
-        json_files = list(self.data_dir.glob('*.json'))
+        # The known fixtures were already parsed in setUpClass
+        fixtures = ('questions', 'personality_types', 'cognitive_functions')
+        for name in fixtures:
+            self.assertTrue(getattr(self, name), f"{name}.json is empty")
         
-        for filepath in json_files:
+        # Only files added alongside them still need parsing here
+        for filepath in self.data_dir.glob('*.json'):
+            if filepath.stem in fixtures:
+                continue
             try:
-                with open(filepath) as f:
-                    json.load(f)
+                loads(filepath.read_bytes())
             except json.JSONDecodeError as e:
                 self.fail(f"Invalid JSON in {filepath.name}: {e}")
     
     def test_question_types_valid(self):
         """Test that question types are consistent."""
-        with open(self.data_dir / 'questions.json') as f:
-            data = json.load(f)
-        
-        # Collect all question types
-        types = set(q['type'] for q in data['questions'])
+        types = self.types
         
         # Should have various question types
         self.assertGreater(len(types), 3, "Should have at least 4 different question types")
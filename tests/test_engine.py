@@ -4,34 +4,63 @@ These tests verify the core test flow, question selection, and result calculatio
 """
 
 import unittest
+import json
+from collections import Counter
 import tempfile
-import shutil
+from unittest.mock import patch
 from pathlib import Path
 import sys
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
-from core.test_engine import TestEngine
 from config.settings import SETTINGS, TEST_CONFIGS
 
 
+def _seed_scorer(engine, responses):
+    """
+    Record responses straight on the engine's scorer.
+    
+    Skips per-answer validation and session writes, for tests that only
+    care about scoring. Responses pair with engine.questions in order.
+    """
+    for question, value in zip(engine.questions, responses):
+        engine.scorer.add_response(question['id'], question, value)
+
+
 class TestTestEngine(unittest.TestCase):
     """Test the main test engine functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root shared by every test's session directory."""
+        # Imported here so the engine loads only when these tests run
+        from core.test_engine import TestEngine
+        cls.TestEngine = TestEngine
+        
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.temp_root = Path(cls._tmp.name)
+        # Only the resume/listing tests need session files on disk; the
+        # patch restores both settings as they were in tearDownClass
+        cls._settings_patch = patch.dict(SETTINGS, {'persist_sessions': False})
+        cls._settings_patch.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Restore settings and remove all session directories in one pass."""
+        cls._settings_patch.stop()
+        cls._tmp.cleanup()
+    
     def setUp(self):
         """Set up test fixtures."""
-        # Create temporary directory for sessions
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.original_session_dir = SETTINGS['session_directory']
+        # Fresh session directory per test so session listings stay isolated
+        self.temp_dir = Path(tempfile.mkdtemp(dir=self.temp_root))
         SETTINGS['session_directory'] = self.temp_dir
         
-        self.engine = TestEngine()
-        
-    def tearDown(self):
-        """Clean up temporary directory."""
-        SETTINGS['session_directory'] = self.original_session_dir
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+        self.engine = self.TestEngine()
+        # Closed so the exit-time flush doesn't revisit its session
+        self.addCleanup(self.engine.close)
     
     def test_engine_initialization(self):
         """Test that engine initializes with required components."""
@@ -42,56 +71,32 @@ class TestTestEngine(unittest.TestCase):
         self.assertIsNotNone(self.engine.validator)
         self.assertIsNotNone(self.engine.result_analyzer)
     
-    def test_initialize_short_test(self):
-        """Test initialization of short test."""
-        session_id = self.engine.initialize_test('short')
-        
-        self.assertIsNotNone(session_id)
-        self.assertEqual(self.engine.test_length, 'short')
-        self.assertEqual(len(self.engine.questions), TEST_CONFIGS['short']['total_questions'])
-        self.assertEqual(self.engine.current_index, 0)
-        
-        # Verify questions are balanced across dimensions
-        dimensions = {}
-        for q in self.engine.questions:
-            dim = q['dimension']
-            dimensions[dim] = dimensions.get(dim, 0) + 1
-        
-        # Should have 4 questions per dimension for short test
-        for count in dimensions.values():
-            self.assertEqual(count, 4)
-    
-    def test_initialize_medium_test(self):
-        """Test initialization of medium test."""
-        session_id = self.engine.initialize_test('medium')
-        
-        self.assertEqual(len(self.engine.questions), TEST_CONFIGS['medium']['total_questions'])
-        
-        # Verify priority distribution
-        priorities = [q['priority'] for q in self.engine.questions]
-        
-        # Medium test should have priority 1 and 2 questions
-        self.assertIn(1, priorities)
-        self.assertIn(2, priorities)
-        self.assertNotIn(3, priorities)  # Should not have priority 3
-    
-    def test_initialize_long_test(self):
-        """Test initialization of long test."""
-        session_id = self.engine.initialize_test('long')
-        
-        self.assertEqual(len(self.engine.questions), TEST_CONFIGS['long']['total_questions'])
-        
-        # Should have all priority levels
-        priorities = set(q['priority'] for q in self.engine.questions)
-        self.assertEqual(priorities, {1, 2, 3})
-    
-    def test_question_selection_priorities(self):
-        """Test that questions are selected according to priority."""
-        self.engine.initialize_test('short')
-        
-        # Short test should only have priority 1 questions
-        for q in self.engine.questions:
-            self.assertEqual(q['priority'], 1)
+    def test_initialize_test(self):
+        """Test initialization and priority selection for each test length."""
+        # Short tests draw only core questions; longer ones add lower priorities
+        expected_priorities = {
+            'short': {1},
+            'medium': {1, 2},
+            'long': {1, 2, 3},
+        }
+        
+        for length, priorities in expected_priorities.items():
+            with self.subTest(length=length):
+                session_id = self.engine.initialize_test(length)
+                config = TEST_CONFIGS[length]
+                
+                self.assertIsNotNone(session_id)
+                self.assertEqual(self.engine.test_length, length)
+                self.assertEqual(len(self.engine.questions), config['total_questions'])
+                self.assertEqual(self.engine.current_index, 0)
+                
+                # Verify questions are balanced across dimensions
+                dimensions = Counter(q['dimension'] for q in self.engine.questions)
+                for count in dimensions.values():
+                    self.assertEqual(count, config['questions_per_dimension'])
+                
+                # Verify priority distribution
+                self.assertEqual({q['priority'] for q in self.engine.questions}, priorities)
     
     def test_get_current_question(self):
         """Test getting the current question."""
@@ -133,10 +138,42 @@ class TestTestEngine(unittest.TestCase):
         invalid_values = [0, 6, -1, 'abc', None]
         
         for value in invalid_values:
-            result = self.engine.submit_response(value)
-            self.assertFalse(result)
-            # Should not advance
-            self.assertEqual(self.engine.current_index, 0)
+            with self.subTest(value=value):
+                result = self.engine.submit_response(value)
+                self.assertFalse(result)
+                # Should not advance
+                self.assertEqual(self.engine.current_index, 0)
+    
+    @patch.dict(SETTINGS, {'persist_sessions': True})
+    def test_submit_responses(self):
+        """Test submitting several responses with a single session save."""
+        self.engine.initialize_test('short')
+        
+        recorded = self.engine.submit_responses([4, 2, 5])
+        
+        self.assertEqual(recorded, 3)
+        self.assertEqual(self.engine.current_index, 3)
+        self.assertEqual(len(self.engine.scorer.responses), 3)
+        
+        session = self.engine.session_manager
+        with open(session.session_file) as f:
+            saved = json.load(f)
+        self.assertEqual([r['value'] for r in saved['responses']], [4, 2, 5])
+        self.assertEqual(saved['current_question'], 3)
+        
+        # Values beyond the last question are ignored
+        self.assertEqual(self.engine.submit_responses([3] * 20), 13)
+        self.assertTrue(self.engine.is_complete())
+    
+    def test_submit_responses_invalid_batch(self):
+        """Test that an invalid value rejects the whole batch."""
+        self.engine.initialize_test('short')
+        
+        for batch in ([3, 4, "maybe"], [3, None]):
+            with self.subTest(batch=batch):
+                self.assertEqual(self.engine.submit_responses(batch), 0)
+                self.assertEqual(self.engine.current_index, 0)
+                self.assertEqual(len(self.engine.scorer.responses), 0)
     
     def test_go_back(self):
         """Test going back to previous question."""
@@ -153,6 +190,9 @@ class TestTestEngine(unittest.TestCase):
         
         self.assertTrue(result)
         self.assertEqual(self.engine.current_index, 1)
+        
+        # The undone answer should no longer count towards the score
+        self.assertEqual(self.engine.scorer.get_response_values(), [3])
     
     def test_go_back_at_start(self):
         """Test that go_back fails at the beginning."""
@@ -173,9 +213,9 @@ class TestTestEngine(unittest.TestCase):
         self.assertEqual(self.engine.current_index, 1)
         
         # Should have recorded a neutral (3) response
-        responses = list(self.engine.scorer.responses.values())
-        self.assertEqual(len(responses), 1)
-        self.assertEqual(responses[0]['value'], 3)
+        skipped_id = self.engine.questions[0]['id']
+        self.assertEqual(len(self.engine.scorer.responses), 1)
+        self.assertEqual(self.engine.scorer.get_response(skipped_id)['value'], 3)
     
     def test_is_complete(self):
         """Test checking if test is complete."""
@@ -185,8 +225,7 @@ class TestTestEngine(unittest.TestCase):
         self.assertFalse(self.engine.is_complete())
         
         # Submit all responses
-        for _ in range(16):
-            self.engine.submit_response(3)
+        self.engine.submit_responses([3] * 16)
         
         # Now should be complete
         self.assertTrue(self.engine.is_complete())
@@ -216,7 +255,7 @@ class TestTestEngine(unittest.TestCase):
         """Test calculating final results."""
         self.engine.initialize_test('short')
         
-        # Submit a pattern that should yield INTJ
+        # A pattern that should yield INTJ
         responses = [
             2, 1, 2, 1,  # E_I - Introversion
             4, 5, 4, 5,  # S_N - Intuition
@@ -224,8 +263,7 @@ class TestTestEngine(unittest.TestCase):
             5, 5, 4, 5   # J_P - Judging
         ]
         
-        for response in responses:
-            self.engine.submit_response(response)
+        _seed_scorer(self.engine, responses)
         
         results = self.engine.calculate_results()
         
@@ -242,10 +280,8 @@ class TestTestEngine(unittest.TestCase):
         """Test response validation."""
         self.engine.initialize_test('short')
         
-        # Submit valid mixed responses
-        for i in range(16):
-            value = (i % 5) + 1  # Cycles through 1-5
-            self.engine.submit_response(value)
+        # Record valid mixed responses, cycling through 1-5
+        _seed_scorer(self.engine, [(i % 5) + 1 for i in range(16)])
         
         is_valid, message = self.engine.validate_responses()
         
@@ -257,14 +293,14 @@ class TestTestEngine(unittest.TestCase):
         self.engine.initialize_test('short')
         
         # Submit all same responses
-        for _ in range(16):
-            self.engine.submit_response(3)
+        self.engine.submit_responses([3] * 16)
         
         is_valid, message = self.engine.validate_responses()
         
         self.assertFalse(is_valid)
         self.assertIn('identical', message.lower())
     
+    @patch.dict(SETTINGS, {'persist_sessions': True})
     def test_resume_test(self):
         """Test resuming a previous test."""
         # Initialize and partially complete a test
@@ -275,7 +311,8 @@ class TestTestEngine(unittest.TestCase):
             self.engine.submit_response(3)
         
         # Create new engine instance
-        new_engine = TestEngine()
+        new_engine = self.TestEngine()
+        self.addCleanup(new_engine.close)
         
         # Resume the test
         success = new_engine.resume_test(original_session_id)
@@ -288,20 +325,41 @@ class TestTestEngine(unittest.TestCase):
         # Should have reloaded responses
         self.assertEqual(len(new_engine.scorer.responses), 8)
     
+    @patch.dict(SETTINGS, {'persist_sessions': True})
+    def test_resume_preserves_question_order(self):
+        """Test that a resumed test asks questions in the original order."""
+        session_id = self.engine.initialize_test('short')
+        self.engine.submit_response(4)
+        
+        new_engine = self.TestEngine()
+        self.addCleanup(new_engine.close)
+        
+        self.assertTrue(new_engine.resume_test(session_id))
+        
+        self.assertEqual(
+            [q['id'] for q in new_engine.questions],
+            [q['id'] for q in self.engine.questions]
+        )
+        self.assertEqual(new_engine.get_current_question(), self.engine.get_current_question())
+    
     def test_resume_nonexistent_session(self):
         """Test attempting to resume non-existent session."""
         result = self.engine.resume_test('nonexistent_id')
         
         self.assertFalse(result)
     
+    @patch.dict(SETTINGS, {'persist_sessions': True})
     def test_get_available_sessions(self):
         """Test getting list of resumable sessions."""
         # Create multiple sessions
-        engine1 = TestEngine()
+        engine1 = self.TestEngine()
+        self.addCleanup(engine1.close)
         session1 = engine1.initialize_test('short')
         engine1.submit_response(3)
         
-        engine2 = TestEngine()
+        engine2 = self.TestEngine()
+        self.addCleanup(engine2.close)
+        
         session2 = engine2.initialize_test('medium')
         engine2.submit_response(4)
         
@@ -315,6 +373,7 @@ class TestTestEngine(unittest.TestCase):
         self.assertIn(session1, session_ids)
         self.assertIn(session2, session_ids)
     
+    @patch.dict(SETTINGS, {'persist_sessions': True})
     def test_cleanup_old_sessions(self):
         """Test cleanup functionality."""
         # This should run without errors
@@ -338,8 +397,7 @@ class TestTestEngine(unittest.TestCase):
         self.engine.initialize_test('short')
         
         # Complete test
-        for _ in range(16):
-            self.engine.submit_response(3)
+        self.engine.submit_responses([3] * 16)
         
         # Calculate results
         self.engine.calculate_results()
@@ -353,22 +411,20 @@ class TestTestEngine(unittest.TestCase):
     def test_question_distribution(self):
         """Test that questions are properly distributed across dimensions."""
         for test_type in ['short', 'medium', 'long']:
-            self.engine.initialize_test(test_type)
-            
-            # Count questions per dimension
-            dimension_counts = {}
-            for q in self.engine.questions:
-                dim = q['dimension']
-                dimension_counts[dim] = dimension_counts.get(dim, 0) + 1
-            
-            # All dimensions should have equal questions
-            expected_per_dim = TEST_CONFIGS[test_type]['questions_per_dimension']
-            for dim, count in dimension_counts.items():
-                self.assertEqual(
-                    count, 
-                    expected_per_dim,
-                    f"Dimension {dim} has {count} questions, expected {expected_per_dim} in {test_type} test"
-                )
+            with self.subTest(test_type=test_type):
+                self.engine.initialize_test(test_type)
+                
+                # Count questions per dimension
+                dimension_counts = Counter(q['dimension'] for q in self.engine.questions)
+                
+                # All dimensions should have equal questions
+                expected_per_dim = TEST_CONFIGS[test_type]['questions_per_dimension']
+                for dim, count in dimension_counts.items():
+                    self.assertEqual(
+                        count, 
+                        expected_per_dim,
+                        f"Dimension {dim} has {count} questions, expected {expected_per_dim} in {test_type} test"
+                    )
     
     def test_complete_test_flow(self):
         """Test complete flow from start to results."""
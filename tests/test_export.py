@@ -4,32 +4,37 @@ These tests verify that results can be properly exported in various formats.
 """
 
 import unittest
+import copy
 import json
-import tempfile
 import shutil
+import tempfile
 from pathlib import Path
 from datetime import datetime
 import sys
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
-from utils.exporter import Exporter
-from display.reports import Reports
-from config.settings import SETTINGS
+from tests.support import clear_dir
 
 
 class TestExporter(unittest.TestCase):
     """Test the export functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temporary directory for exports
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.original_export_dir = SETTINGS['export_directory']
-        SETTINGS['export_directory'] = self.temp_dir
-        
-        # Sample results data
-        self.sample_results = {
+    @classmethod
+    def setUpClass(cls):
+        """Import the exporter and build the shared sample results."""
+        from utils.exporter import Exporter
+        cls.Exporter = Exporter
+        
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.export_dir = Path(cls._tmp.name) / 'exports'
+        cls.export_dir.mkdir()
+        
+        # Sample results data, shared read-only; tests that modify it
+        # work on a deep copy
+        cls.sample_results = {
             'mbti_type': 'INTJ',
             'confidence': 75.5,
             'confidence_level': 'Strong',
@@ -97,22 +102,27 @@ class TestExporter(unittest.TestCase):
             }
         }
     
-    def tearDown(self):
-        """Clean up temporary directory."""
-        SETTINGS['export_directory'] = self.original_export_dir
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove all exports in one cleanup."""
+        cls._tmp.cleanup()
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # One export directory for the class, emptied before each test
+        self.temp_dir = self.export_dir
+        clear_dir(self.temp_dir)
     
     def test_export_json(self):
         """Test exporting results as JSON."""
-        filepath = Exporter.export_results(self.sample_results, 'json')
+        filepath = self.Exporter.export_results(self.sample_results, 'json', directory=self.temp_dir)
         
         self.assertIsNotNone(filepath)
-        self.assertTrue(Path(filepath).exists())
         
-        # Verify file contents
-        with open(filepath) as f:
-            exported_data = json.load(f)
+        # Verify file contents; reading fails if the file was not written
+        data = Path(filepath).read_bytes()
+        self.assertTrue(data)
+        exported_data = json.loads(data)
         
         self.assertEqual(exported_data['mbti_type'], 'INTJ')
         self.assertEqual(exported_data['confidence'], 75.5)
@@ -121,14 +131,13 @@ class TestExporter(unittest.TestCase):
     
     def test_export_text(self):
         """Test exporting results as text."""
-        filepath = Exporter.export_results(self.sample_results, 'txt')
+        filepath = self.Exporter.export_results(self.sample_results, 'txt', directory=self.temp_dir)
         
         self.assertIsNotNone(filepath)
-        self.assertTrue(Path(filepath).exists())
         
-        # Verify file contents
-        with open(filepath) as f:
-            content = f.read()
+        # Verify file contents; reading fails if the file was not written
+        content = Path(filepath).read_text()
+        self.assertTrue(content)
         
         self.assertIn('INTJ', content)
         self.assertIn('75.5%', content)
@@ -137,7 +146,7 @@ class TestExporter(unittest.TestCase):
     
     def test_export_filename_format(self):
         """Test that exported files have correct naming format."""
-        filepath = Exporter.export_results(self.sample_results, 'txt')
+        filepath = self.Exporter.export_results(self.sample_results, 'txt', directory=self.temp_dir)
         
         filename = Path(filepath).name
         
@@ -152,14 +161,14 @@ class TestExporter(unittest.TestCase):
     
     def test_export_creates_directory(self):
         """Test that export creates directory if it doesn't exist."""
-        # Use a subdirectory that doesn't exist
-        SETTINGS['export_directory'] = self.temp_dir / 'new_dir'
+        # Use a directory that doesn't exist, outside the flat export directory
+        new_dir = Path(self._tmp.name) / 'new_dir'
         
-        filepath = Exporter.export_results(self.sample_results, 'json')
+        filepath = self.Exporter.export_results(self.sample_results, 'json', directory=new_dir)
         
         self.assertIsNotNone(filepath)
-        self.assertTrue(Path(filepath).exists())
-        self.assertTrue(SETTINGS['export_directory'].exists())
+        self.assertTrue(Path(filepath).read_bytes())
+        self.assertTrue(new_dir.exists())
     
     def test_export_handles_missing_type(self):
         """Test export with missing MBTI type."""
@@ -168,7 +177,7 @@ class TestExporter(unittest.TestCase):
             'dimension_scores': {}
         }
         
-        filepath = Exporter.export_results(incomplete_results, 'txt')
+        filepath = self.Exporter.export_results(incomplete_results, 'txt', directory=self.temp_dir)
         
         self.assertIsNotNone(filepath)
         
@@ -178,22 +187,37 @@ class TestExporter(unittest.TestCase):
     
     def test_export_preserves_special_characters(self):
         """Test that special characters in data are preserved."""
-        results = self.sample_results.copy()
+        results = copy.deepcopy(self.sample_results)
         results['personality_analysis']['overview'] = "Test with special: @#$%^&*()"
         
-        filepath = Exporter.export_results(results, 'json')
+        filepath = self.Exporter.export_results(results, 'json', directory=self.temp_dir)
         
-        with open(filepath) as f:
-            data = json.load(f)
+        data = json.loads(Path(filepath).read_bytes())
         
         self.assertIn('@#$%^&*()', data['personality_analysis']['overview'])
     
+    def test_atomic_write_cleans_up_on_failure(self):
+        """Test that a failed atomic write leaves no temporary file behind."""
+        from utils.serialization import write_atomic
+        
+        # Renaming a file over a non-empty directory fails
+        target = self.temp_dir / 'occupied'
+        target.mkdir()
+        (target / 'keep').touch()
+        # setUp only clears flat files, so remove the directory afterwards
+        self.addCleanup(shutil.rmtree, target)
+        
+        with self.assertRaises(OSError):
+            write_atomic(target, b'{}')
+        
+        self.assertEqual(sorted(p.name for p in self.temp_dir.iterdir()), ['occupied'])
+    
     def test_copy_to_clipboard_mock(self):
         """Test clipboard functionality (mocked since clipboard may not work in test env)."""
         # This test is limited since clipboard functionality depends on system
         # We mainly test that the function doesn't crash
         try:
-            result = Exporter.copy_to_clipboard(self.sample_results)
+            result = self.Exporter.copy_to_clipboard(self.sample_results)
             # Result depends on whether pyperclip is available and working
             self.assertIsInstance(result, bool)
         except Exception as e:
@@ -204,9 +228,14 @@ class TestExporter(unittest.TestCase):
 class TestReports(unittest.TestCase):
     """Test the report generation functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.sample_results = {
+    @classmethod
+    def setUpClass(cls):
+        """Import the report builder and build the shared sample results."""
+        from display.reports import Reports
+        cls.Reports = Reports
+        
+        # Shared read-only; tests that modify it work on a deep copy
+        cls.sample_results = {
             'mbti_type': 'ENFP',
             'confidence': 68.5,
             'dimension_scores': {
@@ -246,10 +275,17 @@ class TestReports(unittest.TestCase):
                 'career_matches': ['Marketing', 'Counselor', 'Teacher']
             }
         }
+        # Report for the unmodified sample, shared by the read-only tests
+        cls.summary = Reports.generate_summary_report(cls.sample_results)
+    
+    def assertAllIn(self, tokens, text):
+        """Assert every token occurs in text."""
+        missing = [t for t in tokens if t not in text]
+        self.assertFalse(missing, f"Missing from text: {missing}")
     
     def test_generate_summary_report(self):
         """Test generation of text summary report."""
-        summary = Reports.generate_summary_report(self.sample_results)
+        summary = self.summary
         
         self.assertIsInstance(summary, str)
         self.assertGreater(len(summary), 100)
@@ -265,17 +301,16 @@ class TestReports(unittest.TestCase):
     
     def test_summary_report_structure(self):
         """Test that summary report has proper structure."""
-        summary = Reports.generate_summary_report(self.sample_results)
+        summary = self.summary
         
         lines = summary.split('\n')
         
-        # Should have headers
-        self.assertIn('MBTI PERSONALITY TEST RESULTS', summary)
-        self.assertIn('DIMENSION SCORES:', summary)
-        
-        # Should have separators
-        self.assertIn('=' * 60, summary)
-        self.assertIn('-' * 40, summary)
+        self.assertAllIn([
+            # Should have headers
+            'MBTI PERSONALITY TEST RESULTS', 'DIMENSION SCORES:',
+            # Should have separators
+            '=' * 60, '-' * 40
+        ], summary)
     
     def test_summary_handles_missing_fields(self):
         """Test that summary handles missing optional fields gracefully."""
@@ -290,7 +325,7 @@ class TestReports(unittest.TestCase):
             }
         }
         
-        summary = Reports.generate_summary_report(minimal_results)
+        summary = self.Reports.generate_summary_report(minimal_results)
         
         self.assertIsInstance(summary, str)
         self.assertIn('ISTP', summary)
@@ -298,38 +333,30 @@ class TestReports(unittest.TestCase):
     
     def test_summary_dimension_formatting(self):
         """Test that dimensions are properly formatted in summary."""
-        summary = Reports.generate_summary_report(self.sample_results)
+        summary = self.summary
         
         # Check each dimension is formatted with percentage
-        self.assertIn('Extraversion', summary)
-        self.assertIn('65.0%', summary)
-        
-        self.assertIn('Intuition', summary)
-        self.assertIn('70.0%', summary)
-        
-        self.assertIn('Feeling', summary)
-        self.assertIn('68.0%', summary)
-        
-        self.assertIn('Perceiving', summary)
-        self.assertIn('71.0%', summary)
+        self.assertAllIn([
+            'Extraversion', '65.0%',
+            'Intuition', '70.0%',
+            'Feeling', '68.0%',
+            'Perceiving', '71.0%'
+        ], summary)
     
     def test_summary_includes_all_sections(self):
         """Test that all expected sections are included when data is complete."""
-        complete_results = self.sample_results.copy()
+        complete_results = copy.deepcopy(self.sample_results)
         complete_results['personality_analysis']['weaknesses'] = ['Overly idealistic']
         complete_results['personality_analysis']['famous_examples'] = ['Robin Williams']
         
-        summary = Reports.generate_summary_report(complete_results)
-        
-        # Check for presence of sections
-        self.assertIn('PERSONALITY OVERVIEW:', summary)
-        self.assertIn('STRENGTHS:', summary)
-        self.assertIn('RECOMMENDED CAREERS:', summary)
+        summary = self.Reports.generate_summary_report(complete_results)
         
-        # Check content
-        self.assertIn('Enthusiastic and creative', summary)
-        self.assertIn('Creative', summary)
-        self.assertIn('Marketing', summary)
+        self.assertAllIn([
+            # Sections
+            'PERSONALITY OVERVIEW:', 'STRENGTHS:', 'RECOMMENDED CAREERS:',
+            # Content
+            'Enthusiastic and creative', 'Creative', 'Marketing'
+        ], summary)
 
 
 if __name__ == '__main__':
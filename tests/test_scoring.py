@@ -43,8 +43,8 @@ class TestMBTIScorer(unittest.TestCase):
         
         self.assertEqual(len(self.scorer.responses), 1)
         self.assertIn('E_I_001', self.scorer.responses)
-        self.assertEqual(self.scorer.responses['E_I_001']['value'], 5)
-        self.assertEqual(self.scorer.responses['E_I_001']['dimension'], 'E_I')
+        self.assertEqual(self.scorer.get_response('E_I_001')['value'], 5)
+        self.assertEqual(self.scorer.get_response('E_I_001')['dimension'], 'E_I')
     
     def test_reverse_coded_questions(self):
         """Test that reverse-coded questions are handled correctly."""
@@ -163,6 +163,23 @@ class TestMBTIScorer(unittest.TestCase):
         self.assertIn('T_F', all_scores)
         self.assertIn('J_P', all_scores)
     
+    def test_results_unchanged_by_later_responses(self):
+        """Test that results already returned don't change when answers are added."""
+        for dim in ('E_I', 'S_N', 'T_F', 'J_P'):
+            q = {'id': f'{dim}_001', 'dimension': dim, 'reverse_coded': False}
+            self.scorer.add_response(f'{dim}_001', q, 5)
+        
+        results = self.scorer.get_detailed_results()
+        all_scores = self.scorer.calculate_all_dimensions()
+        right_score = results['dimension_scores']['E_I']['right_score']
+        
+        q = {'id': 'E_I_002', 'dimension': 'E_I', 'reverse_coded': False}
+        self.scorer.add_response('E_I_002', q, 1)
+        self.scorer.calculate_all_dimensions()
+        
+        self.assertEqual(results['dimension_scores']['E_I']['right_score'], right_score)
+        self.assertEqual(all_scores['E_I']['right_score'], right_score)
+    
     def test_empty_dimension_handling(self):
         """Test handling of dimensions with no responses."""
         # Add responses only for E_I
@@ -190,6 +207,51 @@ class TestMBTIScorer(unittest.TestCase):
         self.assertEqual(len(self.scorer.responses), 0)
         self.assertEqual(len(self.scorer.dimension_scores), 0)
     
+    def test_remove_response(self):
+        """Test that removing a response updates the dimension score."""
+        for i, value in enumerate([5, 5, 1]):
+            q = {'id': f'E_I_{i:03d}', 'dimension': 'E_I', 'reverse_coded': False}
+            self.scorer.add_response(f'E_I_{i:03d}', q, value)
+        
+        self.assertTrue(self.scorer.remove_response('E_I_002'))
+        self.assertFalse(self.scorer.remove_response('E_I_002'))
+        
+        score = self.scorer.calculate_dimension_score('E_I')
+        
+        self.assertNotIn('E_I_002', self.scorer.responses)
+        self.assertEqual(score['response_count'], 2)
+        self.assertEqual(score['right_score'], 100.0)
+    
+    def test_update_existing_response(self):
+        """Test that re-answering a question replaces its previous value."""
+        q = {'id': 'E_I_001', 'dimension': 'E_I', 'reverse_coded': True}
+        self.scorer.add_response('E_I_001', q, 5)
+        self.scorer.add_response('E_I_001', q, 1)
+        
+        score = self.scorer.calculate_dimension_score('E_I')
+        
+        self.assertEqual(len(self.scorer.responses), 1)
+        self.assertEqual(score['response_count'], 1)
+        self.assertEqual(score['preference'], 'E')
+    
+    def test_dimension_score_cache_invalidation(self):
+        """Test that cached scores are reused until a response changes them."""
+        q = {'id': 'E_I_001', 'dimension': 'E_I', 'reverse_coded': False}
+        self.scorer.add_response('E_I_001', q, 1)
+        
+        first = self.scorer.calculate_dimension_score('E_I')
+        self.assertIs(self.scorer.calculate_dimension_score('E_I'), first)
+        self.assertEqual(first['preference'], 'I')
+        
+        # A new answer must be reflected in the next result
+        q = {'id': 'E_I_002', 'dimension': 'E_I', 'reverse_coded': False}
+        self.scorer.add_response('E_I_002', q, 5)
+        self.scorer.add_response('E_I_003', {'id': 'E_I_003', 'dimension': 'E_I'}, 5)
+        
+        score = self.scorer.calculate_dimension_score('E_I')
+        self.assertEqual(score['preference'], 'E')
+        self.assertEqual(score['response_count'], 3)
+    
     def test_extreme_scores(self):
         """Test handling of extreme scores (all 1s or all 5s)."""
         # Test all 1s (extreme introversion)
@@ -243,6 +305,30 @@ class TestResultAnalyzer(unittest.TestCase):
         self.assertIsInstance(analysis['strengths'], list)
         self.assertGreater(len(analysis['strengths']), 0)
     
+    def test_type_data_loaded_lazily(self):
+        """Test that type descriptions are not read until first needed."""
+        # Construction must not touch the file
+        analyzer = ResultAnalyzer(Path(__file__).parent / 'missing_types.json')
+        self.assertIsNone(analyzer._personality_types)
+        
+        self.assertIsNone(self.analyzer._personality_types)
+        self.analyzer.get_type_analysis('INTJ', {})
+        self.assertIn('INTJ', self.analyzer._personality_types)
+    
+    def test_type_data_shared_between_analyzers(self):
+        """Test that analyzers for the same file parse it only once."""
+        data_path = Path(__file__).parent.parent / 'data' / 'personality_types.json'
+        other = ResultAnalyzer(data_path)
+        
+        self.assertIs(other.personality_types, self.analyzer.personality_types)
+    
+    def test_compatibility_insights(self):
+        """Test that compatible types are the other members of the type's group."""
+        insights = self.analyzer.get_compatibility_insights('INTJ')
+        
+        self.assertEqual(insights['compatible'], ['INTP', 'ENTJ', 'ENTP'])
+        self.assertEqual(self.analyzer.get_compatibility_insights('XXXX')['compatible'], [])
+    
     def test_invalid_type_handling(self):
         """Test handling of invalid personality type."""
         analysis = self.analyzer.get_type_analysis('XXXX', {})
@@ -6,7 +6,7 @@ These tests verify save/resume capabilities and session persistence.
 import unittest
 import json
 import tempfile
-import shutil
+from unittest.mock import patch
 from pathlib import Path
 from datetime import datetime, timedelta
 import sys
@@ -15,30 +15,35 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.session import SessionManager
 from config.settings import SETTINGS
+from tests.support import clear_dir
 
 
 class TestSessionManager(unittest.TestCase):
     """Test the session management functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one session directory and one export directory for the class."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.session_dir = Path(cls._tmp.name) / 'sessions'
+        cls.session_dir.mkdir()
+        cls.export_dir = Path(cls._tmp.name) / 'exports'
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove all test sessions and exports in one cleanup."""
+        cls._tmp.cleanup()
+    
     def setUp(self):
         """Set up test fixtures with temporary directory."""
-        # Create temporary directory for test sessions
-        self.temp_dir = Path(tempfile.mkdtemp())
-        
-        # Override session directory in settings
-        self.original_session_dir = SETTINGS['session_directory']
-        SETTINGS['session_directory'] = self.temp_dir
-        
-        self.session_manager = SessionManager()
-        
-    def tearDown(self):
-        """Clean up temporary directory and restore settings."""
-        # Restore original settings
-        SETTINGS['session_directory'] = self.original_session_dir
-        
-        # Remove temporary directory
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+        # Empty the shared session directory so session listings stay isolated
+        self.temp_dir = self.session_dir
+        clear_dir(self.temp_dir)
+        
+        self.session_manager = SessionManager(self.temp_dir)
+        # Closed even if a test drops the attribute, so the exit-time flush
+        # doesn't revisit it
+        self.addCleanup(self.session_manager.close)
     
     def test_create_session(self):
         """Test creating a new session."""
@@ -93,6 +98,54 @@ class TestSessionManager(unittest.TestCase):
         self.assertEqual(response['value'], 4)
         self.assertEqual(response['dimension'], 'E_I')
     
+    def test_batched_autosave(self):
+        """Test that answers are written in batches when autosave_every > 1."""
+        with patch.dict(SETTINGS, {'autosave_every': 3}):
+            self.session_manager.create_session('short', 16)
+            session_file = self.session_manager.session_file
+            
+            for i in range(2):
+                q_data = {'id': f'E_I_{i:03d}', 'dimension': 'E_I', 'reverse_coded': False}
+                self.session_manager.add_response(f'E_I_{i:03d}', q_data, 4)
+            
+            # Not written yet
+            with open(session_file) as f:
+                self.assertEqual(len(json.load(f)['responses']), 0)
+            
+            self.session_manager.flush()
+            
+            with open(session_file) as f:
+                self.assertEqual(len(json.load(f)['responses']), 2)
+    
+    def test_close_flushes_batched_answers(self):
+        """Test that close() writes pending answers and unregisters the manager."""
+        from core.session import _open_managers
+        
+        with patch.dict(SETTINGS, {'autosave_every': 3}):
+            self.session_manager.create_session('short', 16)
+            q_data = {'id': 'E_I_001', 'dimension': 'E_I', 'reverse_coded': False}
+            self.session_manager.add_response('E_I_001', q_data, 4)
+            
+            self.session_manager.close()
+        
+        with open(self.session_manager.session_file) as f:
+            self.assertEqual(len(json.load(f)['responses']), 1)
+        self.assertNotIn(self.session_manager, _open_managers)
+    
+    def test_persist_sessions_disabled(self):
+        """Test that no session file is written when persistence is off."""
+        with patch.dict(SETTINGS, {'persist_sessions': False}):
+            self.session_manager.create_session('short', 16)
+            q_data = {'id': 'E_I_001', 'dimension': 'E_I', 'reverse_coded': False}
+            self.session_manager.add_response('E_I_001', q_data, 4)
+            
+            self.assertFalse(self.session_manager.session_file.exists())
+            self.assertEqual(len(self.session_manager.current_session['responses']), 1)
+        
+        # Answers skipped while persistence was off aren't owed to disk later
+        self.session_manager.flush()
+        self.assertFalse(self.session_manager.session_file.exists())
+    
     def test_update_existing_response(self):
         """Test updating an existing response (for back navigation)."""
         self.session_manager.create_session('short', 16)
@@ -168,6 +221,22 @@ class TestSessionManager(unittest.TestCase):
         self.assertIn(session2_id, session_ids)
         self.assertNotIn(session3_id, session_ids)
     
+    def test_find_incomplete_sessions_sees_updates(self):
+        """Test that sessions saved by another manager are re-read."""
+        session_id = self.session_manager.create_session('short', 16)
+        self.session_manager.find_incomplete_sessions()
+        
+        # Advance the session from a second manager
+        other_manager = SessionManager(self.temp_dir)
+        self.addCleanup(other_manager.close)
+        other_manager.resume_session(session_id)
+        other_manager.current_session['current_question'] = 7
+        other_manager.save()
+        
+        incomplete = self.session_manager.find_incomplete_sessions()
+        
+        self.assertEqual(incomplete[0]['progress'], '7/16')
+    
     def test_find_incomplete_sessions_timeout(self):
         """Test that old sessions are not returned as resumable."""
         # Create a session with old timestamp
@@ -194,7 +263,8 @@ class TestSessionManager(unittest.TestCase):
             self.session_manager.add_response(f'E_I_{i:03d}', q_data, 3)
         
         # Create new manager instance to simulate restart
-        new_manager = SessionManager()
+        new_manager = SessionManager(self.temp_dir)
+        self.addCleanup(new_manager.close)
         
         # Resume session
         resumed_data = new_manager.resume_session(original_id)
@@ -276,10 +346,6 @@ class TestSessionManager(unittest.TestCase):
     
     def test_export_session_json(self):
         """Test exporting session as JSON."""
-        # Create temp export directory
-        export_dir = self.temp_dir / 'exports'
-        SETTINGS['export_directory'] = export_dir
-        
         self.session_manager.create_session('short', 16)
         
         # Add some data
@@ -288,7 +354,7 @@ class TestSessionManager(unittest.TestCase):
             self.session_manager.add_response(f'E_I_{i:03d}', q_data, 3)
         
         # Export
-        export_path = self.session_manager.export_session('json')
+        export_path = self.session_manager.export_session('json', directory=self.export_dir)
         
         self.assertIsNotNone(export_path)
         self.assertTrue(Path(export_path).exists())
@@ -302,14 +368,10 @@ class TestSessionManager(unittest.TestCase):
     
     def test_export_session_text(self):
         """Test exporting session as text."""
-        # Create temp export directory
-        export_dir = self.temp_dir / 'exports'
-        SETTINGS['export_directory'] = export_dir
-        
         self.session_manager.create_session('medium', 44)
         
         # Export
-        export_path = self.session_manager.export_session('txt')
+        export_path = self.session_manager.export_session('txt', directory=self.export_dir)
         
         self.assertIsNotNone(export_path)
         self.assertTrue(Path(export_path).exists())
@@ -335,7 +397,8 @@ class TestSessionManager(unittest.TestCase):
         del self.session_manager
         
         # Create new manager (simulate restart)
-        new_manager = SessionManager()
+        new_manager = SessionManager(self.temp_dir)
+        self.addCleanup(new_manager.close)
         
         # Should be able to find and resume
         sessions = new_manager.find_incomplete_sessions()
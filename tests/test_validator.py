@@ -200,14 +200,12 @@ class TestResponseValidator(unittest.TestCase):
     
     def test_validate_test_completion_complete(self):
         """Test validation of a properly completed test."""
-        responses = {
-            f'{dim}_{i:03d}': {
-                'dimension': dim,
-                'value': 3
-            }
-            for dim in ['E_I', 'S_N', 'T_F', 'J_P']
-            for i in range(4)
-        }
+        # The validator only reads responses, so each dimension shares one
+        responses = {}
+        for dim in ('E_I', 'S_N', 'T_F', 'J_P'):
+            response = {'dimension': dim, 'value': 3}
+            for i in range(4):
+                responses[f'{dim}_{i:03d}'] = response
         
         is_valid, message = self.validator.validate_test_completion(responses, 16)
         
@@ -300,6 +298,12 @@ class TestResponseValidator(unittest.TestCase):
             with self.assertRaises(ValueError) as context:
                 self.validator.sanitize_response(input_val)
             self.assertIn("cannot parse", str(context.exception).lower())
+    
+    def test_sanitize_response_invalid_type(self):
+        """Test that non-numeric types raise ValueError rather than TypeError."""
+        for input_val in [None, [], {}]:
+            with self.assertRaises(ValueError):
+                self.validator.sanitize_response(input_val)
 
 
 if __name__ == '__main__':
@@ -1,11 +1,24 @@
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from time import sleep
+from time import monotonic, sleep
+from itertools import cycle
 from typing import Callable, Any
-import random
 
 console = Console()
 
+# Shortest gap between screen updates, about one terminal refresh
+_FRAME_SECONDS = 1 / 60
+# Progress bars only need to move smoothly, not every refresh
+_PROGRESS_FRAME_SECONDS = 1 / 30
+# Braille spinner frames, picked up where the last transition left off
+_SPINNER = cycle(("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"))
+# Status messages shown while reveal_result "analyzes", already marked up
+_REVEAL_STEPS = tuple(f"[primary]{msg}[/primary]" for msg in (
+    "Processing personality dimensions...",
+    "Calculating cognitive functions...",
+    "Determining your type..."
+))
+
 class Animations:
     """Animation effects for enhanced user experience."""
     
@@ -18,10 +31,19 @@ class Animations:
             text: Text to display
             delay: Delay between characters
         """
-        for char in text:
-            console.print(char, end="")
-            sleep(delay)
-        console.print()
+        # Plain text, so skip Rich's render pass and write straight to the
+        # terminal; very short delays reveal several characters per frame
+        out = console.file
+        per_frame = max(1, int(_FRAME_SECONDS / delay)) if delay > 0 else max(1, len(text))
+        
+        for start in range(0, len(text), per_frame):
+            chunk = text[start:start + per_frame]
+            out.write(chunk)
+            out.flush()
+            sleep(delay * len(chunk))
+        
+        out.write("\n")
+        out.flush()
     
     @staticmethod
     def fade_in_text(lines: list, delay: float = 0.1):
@@ -65,17 +87,20 @@ class Animations:
         ) as progress:
             task = progress.add_task(task_name, total=steps)
             
-            for _ in range(steps):
-                progress.update(task, advance=1)
-                sleep(delay)
+            # Same total duration, but advance in frames of about
+            # _PROGRESS_FRAME_SECONDS rather than one update per step
+            duration = steps * delay
+            frames = max(1, min(steps, int(duration / _PROGRESS_FRAME_SECONDS)))
+            
+            for frame in range(1, frames + 1):
+                sleep(duration / frames)
+                progress.update(task, completed=steps * frame // frames)
     
     @staticmethod
     def transition_effect():
         """Display a transition effect between screens."""
-        chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
         for _ in range(10):
-            char = random.choice(chars)
-            console.print(f"\r[primary]{char}[/primary]", end="")
+            console.print(f"\r[primary]{next(_SPINNER)}[/primary]", end="")
             sleep(0.05)
         console.print("\r ", end="")
     
@@ -104,14 +129,11 @@ class Animations:
         console.print("\n[primary]Analyzing your responses...[/primary]")
         sleep(1)
         
-        messages = [
-            "Processing personality dimensions...",
-            "Calculating cognitive functions...",
-            "Determining your type..."
-        ]
-        
-        for msg in messages:
-            Animations.loading_spinner(msg, 0.8)
+        # One status display, relabelled for each step
+        with console.status(_REVEAL_STEPS[0], spinner="dots") as status:
+            for step in _REVEAL_STEPS:
+                status.update(step)
+                sleep(0.8)
         
         console.print("\n[bold primary]Your personality type is...[/bold primary]")
         sleep(1)
@@ -140,13 +162,16 @@ class Animations:
         console.print()
     
     @staticmethod
-    def animated_task(func: Callable, message: str = "Processing...") -> Any:
+    def animated_task(func: Callable, message: str = "Processing...",
+                      min_duration: float = 0.0) -> Any:
         """
         Run a function with loading animation.
         
         Args:
             func: Function to run
             message: Loading message
+            min_duration: Keep the spinner up at least this many seconds,
+                counting the time spent in func
             
         Returns:
             Function result
@@ -154,6 +179,10 @@ class Animations:
         result = None
         
         with console.status(f"[primary]{message}[/primary]", spinner="dots"):
+            started = monotonic()
             result = func()
+            remaining = min_duration - (monotonic() - started)
+            if remaining > 0:
+                sleep(remaining)
         
         return result
\ No newline at end of file
@@ -1,15 +1,120 @@
 import pyfiglet
 import questionary
+from rich.console import Group
 from rich.panel import Panel
 from rich.align import Align
 from rich.table import Table
-from rich.progress import Progress, BarColumn, TextColumn, SpinnerColumn
+from rich.text import Text
+from rich.progress import Progress, BarColumn, TextColumn, TaskID
 from rich.layout import Layout
 from rich.columns import Columns
 from rich import box
-from time import sleep
-from typing import Dict, List, Optional
-from ui.themes import console, question_style, DIMENSION_COLORS
+from functools import lru_cache
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from config.settings import SETTINGS
+from ui.themes import console, question_style, DIMENSION_META
+
+def _likert_choices(labels) -> List[questionary.Choice]:
+    """Number the answer labels 1-5, with the Likert value on each choice."""
+    return [
+        questionary.Choice(f"{i}️⃣  {label}", value=i)
+        for i, label in enumerate(labels, 1)
+    ]
+
+# Answer labels for questions without their own options
+_DEFAULT_CHOICES = (
+    "Strongly Disagree",
+    "Disagree",
+    "Neutral",
+    "Agree",
+    "Strongly Agree"
+)
+
+# (title, key, questions, time, description, accuracy) for each test length
+_LENGTH_OPTIONS = (
+    ("⚡ Quick Assessment", "short", "16 questions", "~5 minutes",
+     "Get a basic overview of your personality type", "★★☆☆☆"),
+    ("⚖️  Balanced Test", "medium", "44 questions", "~12 minutes",
+     "Recommended for accurate results", "★★★★☆"),
+    ("🔬 Comprehensive Analysis", "long", "88 questions", "~25 minutes",
+     "Most detailed and accurate assessment", "★★★★★"),
+)
+
+# Info panels for the test length screen, each followed by a blank line;
+# static, so built once and printed in one call
+_LENGTH_PANELS = Group(*(
+    renderable
+    for title, key, questions, time, description, accuracy in _LENGTH_OPTIONS
+    for renderable in (
+        Panel(
+            f"[bold]{questions}[/bold] • {time}\n{description}\nAccuracy: {accuracy}",
+            title=title,
+            border_style="cyan" if key == 'medium' else "dim",
+            box=box.ROUNDED
+        ),
+        ""
+    )
+))
+
+# Test length menu entries mapped to their TEST_CONFIGS keys
+_LENGTH_CHOICES = {
+    "⚡ Quick (16 questions)": "short",
+    "⚖️  Balanced (44 questions) - Recommended": "medium",
+    "🔬 Comprehensive (88 questions)": "long"
+}
+
+@lru_cache(maxsize=None)
+def _type_label(question_type: str) -> str:
+    """Title-case a question type once, e.g. 'work_style' -> 'Work Style'."""
+    return question_type.replace('_', ' ').title()
+
+@lru_cache(maxsize=None)
+def _question_screen() -> Tuple[Layout, Progress, TaskID]:
+    """
+    Build the question screen skeleton once; each question refills it.
+    
+    Returns:
+        Tuple of (layout, progress bar, overall progress task)
+    """
+    layout = Layout()
+    layout.split_column(
+        Layout(name="header", size=3),
+        Layout(name="progress", size=5),
+        Layout(name="question", size=8),
+        Layout(name="footer", size=2)
+    )
+    
+    # Printed as a static snapshot inside the layout, never started as a
+    # live display, so no spinner and no refresh thread
+    progress = Progress(
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(bar_width=40),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        auto_refresh=False
+    )
+    task = progress.add_task("Overall Progress", total=1)
+    
+    # The footer never changes
+    footer_text = "[dim]Use arrow keys or number keys to select • Press 'q' to save and quit[/dim]"
+    layout["footer"].update(Panel(footer_text, box=box.MINIMAL))
+    
+    return layout, progress, task
+
+@lru_cache(maxsize=None)
+def _banner_lines(text: str, font: str) -> Tuple[str, ...]:
+    """
+    Render a figlet banner once per text and font.
+    
+    Args:
+        text: Banner text
+        font: pyfiglet font name
+        
+    Returns:
+        The banner's non-empty lines
+    """
+    rendered = pyfiglet.figlet_format(text, font=font)
+    return tuple(line for line in rendered.split('\n') if line.strip())
 
 class UIComponents:
     """Reusable UI components for the MBTI test."""
@@ -20,24 +125,19 @@ class UIComponents:
         console.clear()
         
         # ASCII art with animation
-        ascii_title = pyfiglet.figlet_format("MBTI", font="slant")
-        lines = ascii_title.split('\n')
-        
-        # Animated reveal
-        for line in lines:
-            if line.strip():  # Only print non-empty lines
+        banner_lines = _banner_lines("MBTI", "slant")
+        if SETTINGS['animations_enabled'] and console.is_terminal:
+            # Animated reveal, paced against a deadline so sleep overshoot
+            # doesn't add up across lines
+            next_line_at = monotonic()
+            for line in banner_lines:
                 console.print(f"[primary]{line}[/primary]", justify="center")
-                sleep(0.03)  # Fast, smooth animation
-        
-        # Subtitle
-        console.print(
-            "[bold white]Personality Type Assessment[/bold white]",
-            justify="center"
-        )
-        console.print(
-            "[muted]Discover your cognitive preferences[/muted]",
-            justify="center"
-        )
+                next_line_at += 0.03  # Fast, smooth animation
+                remaining = next_line_at - monotonic()
+                if remaining > 0:
+                    sleep(remaining)
+        else:
+            console.print("\n".join(banner_lines), style="primary", justify="center")
         
         # Welcome panel
         welcome_text = """
@@ -60,8 +160,14 @@ This scientifically-designed test will help you:
             title="[bold primary]About This Test[/bold primary]"
         )
         
-        console.print("\n")
-        console.print(panel)
+        # Subtitle, spacing and panel in one print
+        console.print(Group(
+            Text.from_markup("[bold white]Personality Type Assessment[/bold white]", justify="center"),
+            Text.from_markup("[muted]Discover your cognitive preferences[/muted]", justify="center"),
+            "",
+            "",
+            panel
+        ))
         
         input()  # Wait for user
     
@@ -77,74 +183,23 @@ This scientifically-designed test will help you:
         console.rule("[primary]Choose Your Test Length[/primary]")
         console.print("\n")
         
-        # Create info panels for each option
-        options_data = [
-            {
-                "title": "⚡ Quick Assessment",
-                "key": "short",
-                "questions": "16 questions",
-                "time": "~5 minutes",
-                "description": "Get a basic overview of your personality type",
-                "accuracy": "★★☆☆☆"
-            },
-            {
-                "title": "⚖️  Balanced Test",
-                "key": "medium", 
-                "questions": "44 questions",
-                "time": "~12 minutes",
-                "description": "Recommended for accurate results",
-                "accuracy": "★★★★☆"
-            },
-            {
-                "title": "🔬 Comprehensive Analysis",
-                "key": "long",
-                "questions": "88 questions",
-                "time": "~25 minutes",
-                "description": "Most detailed and accurate assessment",
-                "accuracy": "★★★★★"
-            }
-        ]
-        
         # Display option panels
-        for opt in options_data:
-            content = f"""
-[bold]{opt['questions']}[/bold] • {opt['time']}
-{opt['description']}
-Accuracy: {opt['accuracy']}
-            """
-            
-            panel = Panel(
-                content.strip(),
-                title=opt['title'],
-                border_style="cyan" if opt['key'] == 'medium' else "dim",
-                box=box.ROUNDED
-            )
-            console.print(panel)
-            console.print()
+        console.print(_LENGTH_PANELS)
         
-        # Create choice list
+        # Each choice carries its TEST_CONFIGS key as the value
         choices = [
-            "⚡ Quick (16 questions)",
-            "⚖️  Balanced (44 questions) - Recommended",
-            "🔬 Comprehensive (88 questions)"
+            questionary.Choice(title, value=key)
+            for title, key in _LENGTH_CHOICES.items()
         ]
         
-        choice = questionary.select(
+        return questionary.select(
             "Select your preferred test length:",
             choices=choices,
             style=question_style,
             pointer="▶",
             use_shortcuts=True,
-            default=choices[1]  # Default to balanced
+            default='medium'  # Default to balanced
         ).ask()
-        
-        # Map choice to key
-        if "Quick" in choice:
-            return "short"
-        elif "Balanced" in choice:
-            return "medium"
-        else:
-            return "long"
     
     @staticmethod
     def display_question(question_data: Dict, current: int, total: int, progress_data: Dict = None):
@@ -160,44 +215,19 @@ Accuracy: {opt['accuracy']}
         Returns:
             User's response value (1-5)
         """
-        console.clear()
-        
-        # Create layout
-        layout = Layout()
-        layout.split_column(
-            Layout(name="header", size=3),
-            Layout(name="progress", size=5),
-            Layout(name="question", size=8),
-            Layout(name="footer", size=2)
-        )
+        # Reuse the layout and progress bar, refilling what changes
+        layout, progress, task = _question_screen()
         
         # Header
         header_text = f"[bold primary]MBTI Assessment[/bold primary] • Question {current} of {total}"
         layout["header"].update(Panel(header_text, box=box.MINIMAL))
         
         # Progress bar
-        progress = Progress(
-            SpinnerColumn(),
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(bar_width=40),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        )
-        
-        task = progress.add_task(
-            f"Overall Progress",
-            total=total,
-            completed=current-1
-        )
+        progress.update(task, total=total, completed=current-1)
         
         # Add dimension indicator
         dimension = question_data['dimension']
-        dim_color = DIMENSION_COLORS.get(dimension, 'white')
-        dim_name = {
-            'E_I': 'Extraversion/Introversion',
-            'S_N': 'Sensing/Intuition',
-            'T_F': 'Thinking/Feeling',
-            'J_P': 'Judging/Perceiving'
-        }.get(dimension, dimension)
+        dim_color, dim_name = DIMENSION_META.get(dimension, ('white', dimension))
         
         progress_panel = Panel(
             progress,
@@ -208,7 +238,7 @@ Accuracy: {opt['accuracy']}
         layout["progress"].update(progress_panel)
         
         # Question panel
-        question_type = question_data.get('type', 'general').replace('_', ' ').title()
+        question_type = _type_label(question_data.get('type', 'general'))
         
         question_panel = Panel(
             f"\n[bold white]{question_data['text']}[/bold white]\n",
@@ -219,30 +249,23 @@ Accuracy: {opt['accuracy']}
         )
         layout["question"].update(question_panel)
         
-        # Footer
-        footer_text = "[dim]Use arrow keys or number keys to select • Press 'q' to save and quit[/dim]"
-        layout["footer"].update(Panel(footer_text, box=box.MINIMAL))
-        
-        # Display layout
-        console.print(layout)
-        console.print()
-        
-        # Get response with custom options
-        choices = [
-            "1️⃣  Strongly Disagree",
-            "2️⃣  Disagree", 
-            "3️⃣  Neutral",
-            "4️⃣  Agree",
-            "5️⃣  Strongly Agree"
-        ]
+        # Clear and redraw in one write so the screen doesn't flash blank
+        # between questions
+        with console.capture() as capture:
+            console.clear()
+            console.print(layout)
+            console.print()
+        console.file.write(capture.get())
+        console.file.flush()
         
         # Show options based on question wording
+        # Fresh Choice objects each time: questionary writes its shortcut
+        # keys onto them, so reused ones come back renumbered
         if question_data.get('options'):
             # Use custom options if provided
-            choices = [
-                f"{i+1}️⃣  {opt['text']}" 
-                for i, opt in enumerate(question_data['options'])
-            ]
+            choices = _likert_choices(opt['text'] for opt in question_data['options'])
+        else:
+            choices = _likert_choices(_DEFAULT_CHOICES)
         
         answer = questionary.select(
             "",
@@ -253,12 +276,8 @@ Accuracy: {opt['accuracy']}
             instruction="(Use arrow keys or press 1-5)"
         ).ask()
         
-        if answer is None:  # User pressed Ctrl+C or quit
-            return None
-        
-        # Extract value from answer
-        # The value is the first character (the number emoji)
-        return int(answer[0])
+        # None when the user pressed Ctrl+C or quit
+        return answer
     
     @staticmethod
     def display_progress_summary(progress_data: Dict):
@@ -303,8 +322,9 @@ Accuracy: {opt['accuracy']}
             console.print(table)
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def _create_text_progress_bar(current: int, total: int, width: int = 20) -> str:
-        """Create a text-based progress bar."""
+        """Create a text-based progress bar, cached since the inputs are small ints."""
         if total == 0:
             return "░" * width
         
@@ -342,14 +362,16 @@ Accuracy: {opt['accuracy']}
         console.print(table)
         console.print()
         
-        # Create choices
-        choices = ["🆕 Start New Test"]
-        session_map = {}
+        # Create choices; each resume entry carries its session ID as the
+        # value, and a new test is the empty string (a None value would
+        # fall back to the title)
+        choices = [questionary.Choice("🆕 Start New Test", value="")]
         
-        for i, session in enumerate(sessions[:5]):
-            choice_text = f"📂 Resume {session['test_length'].title()} test ({session['progress']})"
-            choices.append(choice_text)
-            session_map[choice_text] = session['id']
+        for session in sessions[:5]:
+            choices.append(questionary.Choice(
+                f"📂 Resume {session['test_length'].title()} test ({session['progress']})",
+                value=session['id']
+            ))
         
         choice = questionary.select(
             "What would you like to do?",
@@ -358,10 +380,7 @@ Accuracy: {opt['accuracy']}
             pointer="▶"
         ).ask()
         
-        if "Start New" in choice:
-            return None
-        
-        return session_map.get(choice)
+        return choice or None
     
     @staticmethod
     def display_error(message: str):
@@ -403,7 +422,16 @@ Accuracy: {opt['accuracy']}
         ).ask()
     
     @staticmethod
-    def display_loading(message: str = "Processing..."):
-        """Display loading animation."""
+    def display_loading(message: str = "Processing...", func: Optional[Callable] = None) -> Any:
+        """
+        Display a loading spinner while work runs.
+        
+        Args:
+            message: Loading message
+            func: Work to run under the spinner
+            
+        Returns:
+            func's result, or None if no func was given
+        """
         with console.status(f"[primary]{message}[/primary]", spinner="dots"):
-            sleep(1)  # Simulated loading
\ No newline at end of file
+            return func() if func else None
\ No newline at end of file
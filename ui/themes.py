@@ -54,6 +54,14 @@ DIMENSION_COLORS = {
     'J_P': 'dimension_j_p'
 }
 
+# (color, heading) per dimension, for screens that need both
+DIMENSION_META = {
+    'E_I': (DIMENSION_COLORS['E_I'], 'Extraversion/Introversion'),
+    'S_N': (DIMENSION_COLORS['S_N'], 'Sensing/Intuition'),
+    'T_F': (DIMENSION_COLORS['T_F'], 'Thinking/Feeling'),
+    'J_P': (DIMENSION_COLORS['J_P'], 'Judging/Perceiving')
+}
+
 # ASCII art styles
 ASCII_FONTS = {
     'title': 'slant',
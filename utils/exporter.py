@@ -1,29 +1,33 @@
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 from config.settings import SETTINGS
 from display.reports import Reports
+from utils.serialization import dumps, write_atomic
 
 class Exporter:
     """Handle exporting test results in various formats."""
     
     @staticmethod
-    def export_results(results: Dict, format: str = 'txt') -> Optional[str]:
+    def export_results(results: Dict, format: str = 'txt',
+                       directory: Optional[Path] = None) -> Optional[str]:
         """
         Export test results to file.
         
         Args:
             results: Complete results dictionary
             format: Export format (txt/json)
+            directory: Where to write the file, defaults to SETTINGS['export_directory']
             
         Returns:
             File path if successful, None otherwise
         """
-        export_dir = SETTINGS['export_directory']
+        export_dir = directory or SETTINGS['export_directory']
         export_dir.mkdir(exist_ok=True, parents=True)
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # One clock read names the file and stamps the text footer
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         mbti_type = results.get('mbti_type', 'unknown')
         
         try:
@@ -32,7 +36,7 @@ class Exporter:
                 Exporter._export_json(results, filepath)
             else:  # txt
                 filepath = export_dir / f"mbti_results_{mbti_type}_{timestamp}.txt"
-                Exporter._export_text(results, filepath)
+                Exporter._export_text(results, filepath, now)
             
             return str(filepath)
             
@@ -43,18 +47,15 @@ class Exporter:
     @staticmethod
     def _export_json(results: Dict, filepath: Path):
         """Export results as JSON."""
-        with open(filepath, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        write_atomic(filepath, dumps(results, indent=True, default=str))
     
     @staticmethod
-    def _export_text(results: Dict, filepath: Path):
+    def _export_text(results: Dict, filepath: Path, generated: datetime):
         """Export results as formatted text."""
         summary = Reports.generate_summary_report(results)
+        text = f"{summary}\n\nGenerated: {generated:%Y-%m-%d %H:%M:%S}\n"
         
-        with open(filepath, 'w') as f:
-            f.write(summary)
-            f.write("\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write_atomic(filepath, text.encode('utf-8'))
     
     @staticmethod
     def copy_to_clipboard(results: Dict) -> bool:
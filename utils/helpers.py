@@ -1,11 +1,38 @@
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+# Erase the display and move the cursor home
+_CLEAR_SEQUENCE = "\x1b[2J\x1b[H"
+
+# Shown by --disclaimer; plain print keeps that path free of rich imports
+_DISCLAIMER = """
+    ╔══════════════════════════════════════════════════════════════╗
+    ║                         DISCLAIMER                            ║
+    ╠══════════════════════════════════════════════════════════════╣
+    ║ This MBTI assessment is for entertainment and self-reflection ║
+    ║ purposes only. The Myers-Briggs Type Indicator is not        ║
+    ║ scientifically validated for psychological diagnosis or       ║
+    ║ personnel selection. Results should not be used as the sole  ║
+    ║ basis for important life decisions. For professional         ║
+    ║ psychological assessment, please consult a qualified mental   ║
+    ║ health professional.                                          ║
+    ╚══════════════════════════════════════════════════════════════╝
+    """
+
+@lru_cache(maxsize=None)
+def _enable_ansi():
+    """Turn on VT escape handling in the Windows console, once per process."""
+    if os.name == 'nt':
+        os.system('')
+
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    _enable_ansi()
+    sys.stdout.write(_CLEAR_SEQUENCE)
+    sys.stdout.flush()
 
 def check_terminal_size() -> tuple:
     """
@@ -100,17 +127,4 @@ def get_version() -> str:
 
 def display_disclaimer():
     """Display disclaimer about MBTI."""
-    disclaimer = """
-    ╔══════════════════════════════════════════════════════════════╗
-    ║                         DISCLAIMER                            ║
-    ╠══════════════════════════════════════════════════════════════╣
-    ║ This MBTI assessment is for entertainment and self-reflection ║
-    ║ purposes only. The Myers-Briggs Type Indicator is not        ║
-    ║ scientifically validated for psychological diagnosis or       ║
-    ║ personnel selection. Results should not be used as the sole  ║
-    ║ basis for important life decisions. For professional         ║
-    ║ psychological assessment, please consult a qualified mental   ║
-    ║ health professional.                                          ║
-    ╚══════════════════════════════════════════════════════════════╝
-    """
-    print(disclaimer)
\ No newline at end of file
+    print(_DISCLAIMER)
\ No newline at end of file
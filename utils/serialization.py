@@ -0,0 +1,68 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def dumps(data: Any, indent: bool = False,
+          default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize data to JSON bytes, using orjson when available.
+
+    Args:
+        data: JSON-serializable object
+        indent: Pretty-print with two-space indentation
+        default: Called for objects JSON can't encode, as in json.dumps
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=default,
+                            option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, default=default).encode('utf-8')
+    # Compact like orjson, without the stdlib's spaces after separators
+    return json.dumps(data, separators=(',', ':'), default=default).encode('utf-8')
+
+def loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes or text, using orjson when available.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_atomic(path: Path, data: bytes):
+    """
+    Write bytes to a file via a temporary file and rename.
+
+    A reader never sees a half-written file, even if the process is
+    killed mid-write.
+
+    Args:
+        path: Destination file
+        data: Bytes to write
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a stray temp file behind; the caller sees the error
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise